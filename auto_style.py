@@ -6,24 +6,22 @@ Manages plugin lifecycle, menu/toolbar integration, and main dialog creation.
 """
 
 import os
-import webbrowser
+import threading
 
 from qgis.core import Qgis
 from qgis.core import QgsApplication
 from qgis.PyQt.QtCore import QObject
 from qgis.PyQt.QtCore import QSettings
+from qgis.PyQt.QtCore import QTimer
+from qgis.PyQt.QtCore import Qt
 from qgis.PyQt.QtCore import pyqtSignal
 from qgis.PyQt.QtGui import QIcon
 from qgis.PyQt.QtWidgets import QAction
 from qgis.PyQt.QtWidgets import QDialog
-from qgis.PyQt.QtWidgets import QHBoxLayout
-from qgis.PyQt.QtWidgets import QLabel
-from qgis.PyQt.QtWidgets import QMessageBox
-from qgis.PyQt.QtWidgets import QPushButton
-from qgis.PyQt.QtWidgets import QTextEdit
-from qgis.PyQt.QtWidgets import QVBoxLayout
 
 from .core.i18n import tr
+from .core.paths import get_styles_dir
+from .core.update_checker import UPDATE_CACHE_MAX_AGE
 from .core.update_checker import UpdateChecker
 from .core.update_checker import UpdateInfo
 
@@ -31,11 +29,23 @@ from .core.update_checker import UpdateInfo
 SETTINGS_KEY_SKIP_VERSION = "AutoStyle/skip_version"
 SETTINGS_KEY_CHECK_UPDATE = "AutoStyle/check_update_on_startup"
 
+# Delay before the startup update check, in milliseconds
+STARTUP_UPDATE_CHECK_DELAY = 5000
+
+# Plugin icons, reused across plugin reloads
+_ICON_CACHE = {}
+
 
 class UpdateSignal(QObject):
-    """Signal emitter for thread-safe UI updates."""
+    """
+    Signal emitter for thread-safe UI updates.
+
+    The update check runs on a worker thread with no Qt event loop, so
+    QTimer.singleShot() called from there would never fire. A queued signal
+    on a main-thread QObject is the cheapest reliable hop back to the UI.
+    """
 
-    update_checked = pyqtSignal(object)
+    update_checked = pyqtSignal(object, bool)
 
 
 class AutoStyle:
@@ -53,16 +63,36 @@ class AutoStyle:
         self.menu_name = "AutoStyle"
         self.toolbar = None
         self.main_dialog = None
+        self._update_dialog = None
+        self._update_info = None
+        self._styles_dir_mtime = None
 
-        # Update checker
+        # Cached update settings (kept in sync by _skip_version)
+        settings = QSettings()
+        self._check_enabled = settings.value(SETTINGS_KEY_CHECK_UPDATE, True, type=bool)
+        self._skipped_version = settings.value(SETTINGS_KEY_SKIP_VERSION, "")
+
+        # Update checker (at most one check in flight at a time)
         self.update_checker = UpdateChecker(self.plugin_dir)
+        self._update_lock = threading.Lock()
+        self._update_in_flight = False
+        self._update_manual_requested = False
+        self._update_future = None
+        self._startup_timer = None
         self.update_signal = UpdateSignal()
-        self.update_signal.update_checked.connect(self._on_update_checked)
+        self.update_signal.update_checked.connect(
+            self._on_update_checked,
+            Qt.QueuedConnection,
+        )
 
     def initGui(self):
         """Initialize plugin GUI, add menu items and toolbar buttons."""
+        # QIcon yields a null icon for a missing file, no existence check needed
         icon_path = os.path.join(self.plugin_dir, "icon.svg")
-        icon = QIcon(icon_path) if os.path.exists(icon_path) else QIcon()
+        icon = _ICON_CACHE.get(icon_path)
+        if icon is None:
+            icon = QIcon(icon_path)
+            _ICON_CACHE[icon_path] = icon
 
         # Create main action
         self.action_main = QAction(icon, "AutoStyle", self.iface.mainWindow())
@@ -86,8 +116,12 @@ class AutoStyle:
         self.toolbar.setObjectName("AutoStyleToolbar")
         self.toolbar.addAction(self.action_main)
 
-        # Check for updates on startup (async, non-blocking)
-        self._check_update_on_startup()
+        # Check for updates once QGIS has finished starting up (kept as an
+        # attribute so unload() can cancel it)
+        self._startup_timer = QTimer()
+        self._startup_timer.setSingleShot(True)
+        self._startup_timer.timeout.connect(self._check_update_on_startup)
+        self._startup_timer.start(STARTUP_UPDATE_CHECK_DELAY)
 
     def unload(self):
         """Unload plugin, remove menu items and toolbar."""
@@ -104,33 +138,60 @@ class AutoStyle:
             self.main_dialog.close()
             self.main_dialog = None
 
+        if self._update_dialog:
+            self._update_dialog.close()
+            self._update_dialog.deleteLater()
+            self._update_dialog = None
+
+        # Drop a check that has not started yet
+        if self._startup_timer is not None:
+            self._startup_timer.stop()
+            self._startup_timer = None
+        if self._update_future is not None:
+            self._update_future.cancel()
+            self._update_future = None
+        self.update_checker.close()
+
     def show_dialog(self):
         """Show the main dialog."""
         from .ui.panel_widget import MainDialog
 
+        styles_mtime = self._get_styles_dir_mtime()
+
         if self.main_dialog is None:
             self.main_dialog = MainDialog(
                 self.plugin_dir,
                 self.iface,
                 parent=self.iface.mainWindow(),
             )
+        elif styles_mtime is None or styles_mtime != self._styles_dir_mtime:
+            # Refresh config list only when the styles directory changed
+            self.main_dialog._load_configs()
+
+        self._styles_dir_mtime = styles_mtime
 
-        # Refresh config list
-        self.main_dialog._load_configs()
         self.main_dialog.show()
         self.main_dialog.raise_()
         self.main_dialog.activateWindow()
 
+    def _get_styles_dir_mtime(self):
+        """
+        Get the modification time of the styles directory.
+
+        :return: mtime in nanoseconds, or None if the directory is unavailable
+        """
+        try:
+            return os.stat(get_styles_dir()).st_mtime_ns
+        except OSError:
+            return None
+
     def _check_update_on_startup(self):
         """Check for updates on plugin startup."""
-        settings = QSettings()
-
         # Check if update check is enabled (default: True)
-        check_enabled = settings.value(SETTINGS_KEY_CHECK_UPDATE, True, type=bool)
-        if not check_enabled:
+        if not self._check_enabled:
             return
 
-        self.update_checker.check_update_async(self._emit_update_result)
+        self._start_update_check()
 
     def _check_update_manual(self):
         """Manually check for updates (from menu)."""
@@ -140,28 +201,57 @@ class AutoStyle:
             level=Qgis.Info,
             duration=3,
         )
-        self.update_checker.check_update_async(
-            lambda info: self._emit_update_result(info, manual=True)
+        self._start_update_check(manual=True)
+
+    def _start_update_check(self, manual: bool = False):
+        """
+        Start an async update check unless one is already running.
+
+        A manual request made while a check is in flight is merged into it,
+        so the running check reports its result to the user.
+
+        :param manual: Whether this is a manual check
+        """
+        with self._update_lock:
+            if manual:
+                self._update_manual_requested = True
+            if self._update_in_flight:
+                return
+            self._update_in_flight = True
+
+        # Manual checks always ask the server; startup checks may reuse a recent result
+        self._update_future = self.update_checker.check_update_async(
+            self._emit_update_result,
+            max_age=0 if manual else UPDATE_CACHE_MAX_AGE,
         )
 
-    def _emit_update_result(self, update_info: UpdateInfo, manual: bool = False):
+    def _emit_update_result(self, update_info: UpdateInfo):
         """
         Emit update result signal (thread-safe).
 
         :param update_info: Update check result
-        :param manual: Whether this is a manual check
         """
-        # Attach manual flag to info for later use
-        update_info._manual_check = manual
-        self.update_signal.update_checked.emit(update_info)
+        with self._update_lock:
+            manual = self._update_manual_requested
+            self._update_manual_requested = False
+            self._update_in_flight = False
+
+        # Automatic checks with nothing to show never need the main thread
+        if not manual:
+            if update_info.error or not update_info.has_update:
+                return
+            if self._skipped_version == update_info.latest_version:
+                return
 
-    def _on_update_checked(self, update_info: UpdateInfo):
+        self.update_signal.update_checked.emit(update_info, manual)
+
+    def _on_update_checked(self, update_info: UpdateInfo, manual: bool):
         """
         Handle update check result (runs on main thread).
 
         :param update_info: Update check result
+        :param manual: Whether this was a manual check
         """
-        manual = getattr(update_info, '_manual_check', False)
 
         if update_info.error:
             if manual:
@@ -184,9 +274,7 @@ class AutoStyle:
             return
 
         # Check if user chose to skip this version
-        settings = QSettings()
-        skipped_version = settings.value(SETTINGS_KEY_SKIP_VERSION, "")
-        if skipped_version == update_info.latest_version and not manual:
+        if self._skipped_version == update_info.latest_version and not manual:
             return
 
         # Show update dialog
@@ -196,8 +284,38 @@ class AutoStyle:
         """
         Show update available dialog.
 
+        The dialog is built on first use and reused for later prompts.
+
         :param update_info: Update information
         """
+        if self._update_dialog is None:
+            self._build_update_dialog()
+
+        self._update_info = update_info
+
+        msg = tr(
+            'update_available_msg',
+            current=update_info.current_version,
+            latest=update_info.latest_version,
+        )
+        self._update_label.setText(msg)
+
+        has_changelog = bool(update_info.changelog)
+        self._update_changelog_label.setVisible(has_changelog)
+        self._update_changelog_text.setVisible(has_changelog)
+        self._update_changelog_text.setPlainText(update_info.changelog or "")
+
+        self._update_dialog.exec_()
+
+    def _build_update_dialog(self):
+        """Build the reusable update available dialog."""
+        # Only needed when an update is found, so keep them off the plugin load path
+        from qgis.PyQt.QtWidgets import QHBoxLayout
+        from qgis.PyQt.QtWidgets import QLabel
+        from qgis.PyQt.QtWidgets import QPushButton
+        from qgis.PyQt.QtWidgets import QTextEdit
+        from qgis.PyQt.QtWidgets import QVBoxLayout
+
         dialog = QDialog(self.iface.mainWindow())
         dialog.setWindowTitle(tr('update_available_title'))
         dialog.setMinimumSize(450, 300)
@@ -208,35 +326,28 @@ class AutoStyle:
         layout.setSpacing(12)
 
         # Version info
-        msg = tr(
-            'update_available_msg',
-            current=update_info.current_version,
-            latest=update_info.latest_version,
-        )
-        label = QLabel(msg)
-        label.setWordWrap(True)
-        layout.addWidget(label)
+        self._update_label = QLabel()
+        self._update_label.setWordWrap(True)
+        layout.addWidget(self._update_label)
 
         # Changelog
-        if update_info.changelog:
-            changelog_label = QLabel(tr('update_changelog_label'))
-            layout.addWidget(changelog_label)
+        self._update_changelog_label = QLabel(tr('update_changelog_label'))
+        layout.addWidget(self._update_changelog_label)
 
-            changelog_text = QTextEdit()
-            changelog_text.setPlainText(update_info.changelog)
-            changelog_text.setReadOnly(True)
-            changelog_text.setMaximumHeight(150)
-            layout.addWidget(changelog_text)
+        self._update_changelog_text = QTextEdit()
+        self._update_changelog_text.setReadOnly(True)
+        self._update_changelog_text.setMaximumHeight(150)
+        layout.addWidget(self._update_changelog_text)
 
         layout.addStretch()
 
-        # Buttons
+        # Buttons (read the current update info when clicked)
         btn_layout = QHBoxLayout()
         btn_layout.setSpacing(8)
 
         btn_skip = QPushButton(tr('update_skip_version_button'))
         btn_skip.clicked.connect(
-            lambda: self._skip_version(update_info.latest_version, dialog)
+            lambda: self._skip_version(self._update_info.latest_version, dialog)
         )
         btn_layout.addWidget(btn_skip)
 
@@ -249,13 +360,13 @@ class AutoStyle:
         btn_download = QPushButton(tr('update_download_button'))
         btn_download.setDefault(True)
         btn_download.clicked.connect(
-            lambda: self._open_download(update_info.download_url, dialog)
+            lambda: self._open_download(self._update_info.download_url, dialog)
         )
         btn_layout.addWidget(btn_download)
 
         layout.addLayout(btn_layout)
 
-        dialog.exec_()
+        self._update_dialog = dialog
 
     def _skip_version(self, version: str, dialog: QDialog):
         """
@@ -266,6 +377,7 @@ class AutoStyle:
         """
         settings = QSettings()
         settings.setValue(SETTINGS_KEY_SKIP_VERSION, version)
+        self._skipped_version = version
         dialog.accept()
 
     def _open_download(self, url: str, dialog: QDialog):
@@ -276,5 +388,6 @@ class AutoStyle:
         :param dialog: Dialog to close
         """
         if url:
+            import webbrowser
             webbrowser.open(url)
         dialog.accept()
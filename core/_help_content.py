@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+Help Content
+
+HTML help text shown in the help dialog. Kept out of the i18n module so the
+large strings are only loaded when the help dialog is first opened.
+"""
+
+HELP_ZH = """
+<h2>AutoStyle 使用说明</h2>
+
+<h3>功能概述</h3>
+<p>AutoStyle 是一款 QGIS 样式管理插件，支持通过正则表达式匹配图层名称，自动批量应用 QML 样式文件。适用于需要频繁对多个图层应用统一样式的场景，如地图制图、数据可视化等。</p>
+
+<h3>主界面操作</h3>
+<table border="1" cellpadding="8" cellspacing="0" style="border-collapse: collapse; width: 100%;">
+<tr><th style="width: 120px;">按钮</th><th>功能说明</th></tr>
+<tr><td><b>添加</b></td><td>创建新的样式配置表，打开编辑对话框</td></tr>
+<tr><td><b>编辑</b></td><td>编辑当前选中的配置表，修改名称或样式规则</td></tr>
+<tr><td><b>删除</b></td><td>删除当前选中的配置表，删除前会弹出确认对话框</td></tr>
+<tr><td><b>一键应用</b></td><td>遍历当前项目的所有图层，根据配置表中的规则自动匹配并应用样式</td></tr>
+</table>
+
+<h3>配置表编辑</h3>
+<p>编辑对话框支持两种编辑模式，可通过右上角按钮切换：</p>
+
+<p><b>表格模式（默认）</b></p>
+<ul>
+<li><b>+ 添加</b>：在表格末尾添加新规则行</li>
+<li><b>- 删除</b>：删除选中的规则行（支持多选）</li>
+<li><b>↑ 上移 / ↓ 下移</b>：调整规则的优先级顺序</li>
+<li><b>⤒ 置顶 / ⤓ 置底</b>：将选中规则移至最前或最后</li>
+<li>样式文件路径列支持点击 <b>...</b> 按钮浏览选择 QML 文件</li>
+</ul>
+
+<p><b>文本模式</b></p>
+<ul>
+<li>以纯文本方式编辑规则，适合批量复制粘贴</li>
+<li>格式：<code>"正则表达式": "样式文件路径"</code>，每行一条规则</li>
+<li>切换回表格模式时会自动验证格式</li>
+</ul>
+
+<h3>样式规则说明</h3>
+<p>每条规则包含两个部分：</p>
+<ul>
+<li><b>正则表达式</b>：用于匹配图层名称的模式（使用 Python re 模块语法）</li>
+<li><b>样式文件路径</b>：匹配成功后应用的 QML 样式文件的绝对路径</li>
+</ul>
+
+<h3>正则表达式示例</h3>
+<table border="1" cellpadding="8" cellspacing="0" style="border-collapse: collapse; width: 100%;">
+<tr><th>模式</th><th>说明</th><th>匹配示例</th></tr>
+<tr><td><code>^道路.*</code></td><td>匹配以"道路"开头的图层</td><td>道路_主干道、道路边界</td></tr>
+<tr><td><code>.*水系$</code></td><td>匹配以"水系"结尾的图层</td><td>河流水系、湖泊水系</td></tr>
+<tr><td><code>.*建筑.*</code></td><td>匹配包含"建筑"的图层</td><td>住宅建筑、建筑轮廓</td></tr>
+<tr><td><code>^(植被|绿地).*</code></td><td>匹配以"植被"或"绿地"开头</td><td>植被覆盖、绿地公园</td></tr>
+<tr><td><code>(?i)road</code></td><td>不区分大小写匹配包含"road"</td><td>Road_Main、road_01</td></tr>
+<tr><td><code>layer_\\d+</code></td><td>匹配"layer_"后跟数字</td><td>layer_01、layer_123</td></tr>
+</table>
+
+<h3>应用结果说明</h3>
+<p>点击"一键应用"后，插件会遍历当前项目的所有图层并显示结果：</p>
+<ul>
+<li><b>成功</b>：成功匹配规则并应用样式的图层数量</li>
+<li><b>失败</b>：匹配到规则但样式应用失败的图层数量（如样式文件不存在）</li>
+<li><b>未匹配</b>：未匹配到任何规则的图层数量</li>
+</ul>
+<p>详细的处理日志可在 QGIS 消息日志面板（标签：AutoStyle）中查看。</p>
+
+<h3>注意事项</h3>
+<ul>
+<li>规则按顺序从上到下匹配，<b>先匹配到的规则优先应用</b>，后续规则不再处理该图层</li>
+<li>正则表达式默认区分大小写，如需忽略大小写可使用 <code>(?i)</code> 前缀</li>
+<li>样式文件路径建议使用绝对路径，确保文件存在且可访问</li>
+<li>保存配置表时会自动验证正则表达式语法</li>
+<li>配置表数据以 JSON 格式存储在插件目录的 styles 文件夹中</li>
+</ul>
+"""
+
+HELP_EN = """
+<h2>AutoStyle User Guide</h2>
+
+<h3>Overview</h3>
+<p>AutoStyle is a QGIS style management plugin that supports batch applying QML style files to layers by matching layer names with regular expressions. It is suitable for scenarios where you need to frequently apply unified styles to multiple layers, such as cartography and data visualization.</p>
+
+<h3>Main Interface</h3>
+<table border="1" cellpadding="8" cellspacing="0" style="border-collapse: collapse; width: 100%;">
+<tr><th style="width: 120px;">Button</th><th>Description</th></tr>
+<tr><td><b>Add</b></td><td>Create a new style config, opens the edit dialog</td></tr>
+<tr><td><b>Edit</b></td><td>Edit the selected config, modify name or style rules</td></tr>
+<tr><td><b>Delete</b></td><td>Delete the selected config (confirmation required)</td></tr>
+<tr><td><b>Apply</b></td><td>Traverse all layers in the current project and apply styles based on matching rules</td></tr>
+</table>
+
+<h3>Config Editor</h3>
+<p>The edit dialog supports two editing modes, switchable via the button in the top right:</p>
+
+<p><b>Table Mode (Default)</b></p>
+<ul>
+<li><b>+ Add</b>: Add a new rule row at the end of the table</li>
+<li><b>- Remove</b>: Remove selected rule rows (multi-select supported)</li>
+<li><b>↑ Up / ↓ Down</b>: Adjust the priority order of rules</li>
+<li><b>⤒ Top / ⤓ Bottom</b>: Move selected rule to the first or last position</li>
+<li>Click the <b>...</b> button in the style file path column to browse and select QML files</li>
+</ul>
+
+<p><b>Text Mode</b></p>
+<ul>
+<li>Edit rules as plain text, suitable for batch copy-paste</li>
+<li>Format: <code>"pattern": "style_file_path"</code>, one rule per line</li>
+<li>Format validation is performed when switching back to table mode</li>
+</ul>
+
+<h3>Style Rules</h3>
+<p>Each rule contains two parts:</p>
+<ul>
+<li><b>Pattern</b>: Regular expression to match layer names (Python re module syntax)</li>
+<li><b>Style File Path</b>: Absolute path to the QML style file to apply on match</li>
+</ul>
+
+<h3>Regex Examples</h3>
+<table border="1" cellpadding="8" cellspacing="0" style="border-collapse: collapse; width: 100%;">
+<tr><th>Pattern</th><th>Description</th><th>Match Examples</th></tr>
+<tr><td><code>^road.*</code></td><td>Match layers starting with "road"</td><td>road_main, road_boundary</td></tr>
+<tr><td><code>.*river$</code></td><td>Match layers ending with "river"</td><td>main_river, small_river</td></tr>
+<tr><td><code>.*building.*</code></td><td>Match layers containing "building"</td><td>residential_building, building_outline</td></tr>
+<tr><td><code>^(forest|park).*</code></td><td>Match layers starting with "forest" or "park"</td><td>forest_cover, park_area</td></tr>
+<tr><td><code>(?i)road</code></td><td>Case-insensitive match for "road"</td><td>Road_Main, road_01</td></tr>
+<tr><td><code>layer_\\d+</code></td><td>Match "layer_" followed by digits</td><td>layer_01, layer_123</td></tr>
+</table>
+
+<h3>Apply Results</h3>
+<p>After clicking "Apply", the plugin traverses all layers and displays results:</p>
+<ul>
+<li><b>Success</b>: Number of layers that matched rules and had styles applied successfully</li>
+<li><b>Failed</b>: Number of layers that matched rules but style application failed (e.g., style file not found)</li>
+<li><b>Unmatched</b>: Number of layers that didn't match any rules</li>
+</ul>
+<p>Detailed processing logs can be viewed in the QGIS Message Log panel (tab: AutoStyle).</p>
+
+<h3>Notes</h3>
+<ul>
+<li>Rules are matched from top to bottom, <b>first match wins</b>, subsequent rules are not processed for that layer</li>
+<li>Regular expressions are case-sensitive by default, use <code>(?i)</code> prefix for case-insensitive matching</li>
+<li>It is recommended to use absolute paths for style files to ensure they exist and are accessible</li>
+<li>Regex syntax is automatically validated when saving configs</li>
+<li>Config data is stored in JSON format in the styles folder of the plugin directory</li>
+</ul>
+"""
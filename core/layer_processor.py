@@ -7,11 +7,37 @@ Traverses project layers, matches layer names with regex rules, and applies QML
 
 import os
 import re
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Pattern
 
 from qgis.core import Qgis, QgsMapLayer, QgsMessageLog, QgsProject
 
 from .i18n import tr
+from .regex_cache import get_or_compile
+
+# Number of threads used to prefetch style files
+PREFETCH_WORKERS = 4
+
+# Constructs that prevent fusing rule patterns into one regex
+_BACKREF_RE = re.compile(r'\\[1-9]|\(\?P=|\(\?\(')
+# Leading global inline flags, e.g. "(?i)road"
+_GLOBAL_FLAGS_RE = re.compile(r'^\(\?([aiLmsu]+)\)')
+# Any global inline flag group left after rewriting the leading one
+_ANY_GLOBAL_FLAGS_RE = re.compile(r'\(\?[aiLmsux]+\)')
+
+
+def _read_file(path: str) -> None:
+    """
+    Read a file fully, ignoring errors (used for cache warm-up only).
+
+    :param path: File path
+    """
+    try:
+        with open(path, 'rb') as f:
+            while f.read(65536):
+                pass
+    except OSError:
+        pass
 
 
 class LayerProcessor:
@@ -27,11 +53,20 @@ class LayerProcessor:
         """
         self.iface = iface
 
-    def apply_styles(self, rules: List[Dict]) -> Dict:
+    def apply_styles(
+        self,
+        rules: List[Dict],
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> Dict:
         """
         Apply styles to matching layers.
 
+        Styles are loaded on the calling (main) thread; the optional progress
+        callback runs before each style load so the caller can update a
+        progress display and keep the UI responsive.
+
         :param rules: List of style rules, each containing pattern and style_file
+        :param progress: Optional callback receiving (processed layers, total layers)
         :return: Result dict with success, failed, unmatched counts and details list
         """
         result = {
@@ -49,13 +84,17 @@ class LayerProcessor:
             result["details"].append(tr('no_layers'))
             return result
 
+        # Log messages are collected per level and written once at the end
+        info_msgs = []
+        warn_msgs = []
+
         # Pre-compile regex patterns
         compiled_rules = []
         for rule in rules:
             pattern = rule.get("pattern", "")
             style_file = rule.get("style_file", "")
             try:
-                regex = re.compile(pattern)
+                regex = get_or_compile(pattern)
                 compiled_rules.append({
                     "regex": regex,
                     "pattern": pattern,
@@ -63,53 +102,196 @@ class LayerProcessor:
                 })
             except re.error as e:
                 msg = tr('regex_compile_failed', pattern=pattern, error=str(e))
-                QgsMessageLog.logMessage(msg, self.LOG_TAG, Qgis.Warning)
+                warn_msgs.append(msg)
                 result["details"].append(msg)
 
         if not compiled_rules:
+            self._log_batch(warn_msgs, Qgis.Warning)
             result["details"].append(tr('no_valid_rules'))
             return result
 
-        # Traverse layers and apply styles
+        # Fuse all rules into one regex so each layer needs a single match call
+        combined = self._combine_rules(compiled_rules)
+
+        # Match every layer first (hot loop: bind lookups locally), so only the
+        # style files that are actually used get checked and prefetched
+        combined_match = combined.match if combined is not None else None
+        matches = []
         for layer in layers:
             layer_name = layer.name()
-            matched = False
-
-            for rule in compiled_rules:
-                if rule["regex"].search(layer_name):
-                    matched = True
-                    style_file = rule["style_file"]
-
-                    # Check if style file exists
-                    if not os.path.exists(style_file):
-                        msg = tr('style_file_not_exist', layer=layer_name, file=style_file)
-                        QgsMessageLog.logMessage(msg, self.LOG_TAG, Qgis.Warning)
-                        result["details"].append(msg)
-                        result["failed"] += 1
+
+            if combined_match is not None:
+                # The matching rule index is encoded in the group name "r<index>"
+                match = combined_match(layer_name)
+                rule = compiled_rules[int(match.lastgroup[1:])] if match else None
+            else:
+                for rule in compiled_rules:
+                    if rule["regex"].search(layer_name):
                         break
+                else:
+                    rule = None
+            matches.append((layer, layer_name, rule))
+
+        # Check each distinct style file once instead of once per matched layer;
+        # paths are normalized so different spellings of one file share a stat
+        file_exists: Dict[str, bool] = {}
+        existing_files = set()
+        for style_file in {rule["style_file"] for __, __, rule in matches if rule is not None}:
+            path_key = os.path.normcase(os.path.normpath(style_file))
+            if path_key not in file_exists:
+                file_exists[path_key] = os.path.isfile(path_key)
+            if file_exists[path_key]:
+                existing_files.add(style_file)
+        self._prefetch_files(existing_files)
 
-                    # Apply style
-                    success = self._apply_style_to_layer(layer, style_file)
-                    if success:
-                        msg = tr('style_apply_success', layer=layer_name, pattern=rule['pattern'])
-                        QgsMessageLog.logMessage(msg, self.LOG_TAG, Qgis.Info)
-                        result["details"].append(msg)
-                        result["success"] += 1
-                    else:
-                        msg = tr('style_apply_failed', layer=layer_name, file=style_file)
-                        QgsMessageLog.logMessage(msg, self.LOG_TAG, Qgis.Warning)
-                        result["details"].append(msg)
-                        result["failed"] += 1
-                    break
-
-            if not matched:
+        # Matched layer count per missing style file
+        missing_counts: Dict[str, int] = {}
+        # Layers whose style changed, refreshed together after the loop
+        styled_layers = []
+
+        # Apply styles in layer order
+        details = result["details"]
+        total = len(matches)
+        for index, (layer, layer_name, rule) in enumerate(matches):
+            # Unmatched layers are the common case: skip them first
+            if rule is None:
                 msg = tr('layer_unmatched', layer=layer_name)
-                QgsMessageLog.logMessage(msg, self.LOG_TAG, Qgis.Info)
-                result["details"].append(msg)
+                info_msgs.append(msg)
+                details.append(msg)
                 result["unmatched"] += 1
+                continue
+
+            style_file = rule["style_file"]
+
+            # Check if style file exists (report each missing file only once)
+            if style_file not in existing_files:
+                count = missing_counts.get(style_file, 0)
+                if not count:
+                    msg = tr('style_file_not_exist', layer=layer_name, file=style_file)
+                    warn_msgs.append(msg)
+                    details.append(msg)
+                missing_counts[style_file] = count + 1
+                result["failed"] += 1
+                continue
+
+            # Apply style
+            if progress is not None:
+                progress(index, total)
+            success = self._apply_style_to_layer(layer, style_file)
+            if success:
+                styled_layers.append(layer)
+                msg = tr('style_apply_success', layer=layer_name, pattern=rule['pattern'])
+                info_msgs.append(msg)
+                details.append(msg)
+                result["success"] += 1
+            else:
+                msg = tr('style_apply_failed', layer=layer_name, file=style_file)
+                warn_msgs.append(msg)
+                details.append(msg)
+                result["failed"] += 1
+
+        self._refresh_layers(styled_layers)
+
+        for style_file, count in missing_counts.items():
+            if count > 1:
+                msg = tr('style_file_missing_summary', count=count, file=style_file)
+                warn_msgs.append(msg)
+                result["details"].append(msg)
+
+        self._log_batch(info_msgs, Qgis.Info)
+        self._log_batch(warn_msgs, Qgis.Warning)
 
         return result
 
+    def _log_batch(self, messages: List[str], level) -> None:
+        """
+        Write collected messages to the QGIS message log in a single entry.
+
+        :param messages: Messages to write
+        :param level: Qgis message level
+        """
+        if messages:
+            QgsMessageLog.logMessage("\n".join(messages), self.LOG_TAG, level)
+
+    def _combine_rules(self, compiled_rules: List[Dict]) -> Optional[Pattern]:
+        """
+        Fuse all rule patterns into a single regex.
+
+        Each rule becomes a lookahead alternative anchored at the start of the
+        name, so alternatives are tried in rule order and the first rule whose
+        pattern occurs anywhere in the name wins, exactly like searching each
+        rule in turn. The matching rule index is encoded in the group name.
+
+        :param compiled_rules: Validated rules in user order
+        :return: Combined pattern, or None if the rules cannot be fused safely
+        """
+        parts = []
+        for i, rule in enumerate(compiled_rules):
+            pattern = rule["pattern"]
+            # Back-references would point at the wrong groups once wrapped
+            if _BACKREF_RE.search(pattern):
+                return None
+            # Leading global flags such as (?i) must become scoped flags
+            flags = _GLOBAL_FLAGS_RE.match(pattern)
+            if flags:
+                pattern = f"(?{flags.group(1)}:{pattern[flags.end():]})"
+            # Other global flags (e.g. "(?x)", "(?i)(?s)", "foo(?i)") would apply
+            # to every fused rule, or fail to compile on newer Pythons
+            if _ANY_GLOBAL_FLAGS_RE.search(pattern):
+                return None
+            parts.append(rf"(?P<r{i}>(?=[\s\S]*?(?:{pattern})))")
+
+        try:
+            return get_or_compile(r"\A(?:" + "|".join(parts) + ")")
+        except re.error:
+            return None
+
+    def _prefetch_files(self, paths) -> None:
+        """
+        Read style files concurrently so later loads hit the OS file cache.
+
+        loadNamedStyle must run on the main thread and reads its file
+        synchronously; warming the cache first overlaps the disk latency of
+        distinct files, which matters on slow or network drives.
+
+        :param paths: Style file paths
+        """
+        if len(paths) < 2:
+            return
+
+        with ThreadPoolExecutor(max_workers=PREFETCH_WORKERS) as pool:
+            for __ in pool.map(_read_file, paths):
+                pass
+
+    def _refresh_layers(self, layers: List[QgsMapLayer]) -> None:
+        """
+        Repaint styled layers and refresh their legend entries in one pass.
+
+        :param layers: Layers whose style was changed
+        """
+        if not layers:
+            return
+
+        # Project signals are left unblocked: repaints and legend refreshes do
+        # not emit them, and blocking would hide the project's dirty-state
+        # change from the style loads
+        try:
+            # Refresh layer display
+            for layer in layers:
+                layer.triggerRepaint()
+
+            # Refresh legend in layer panel
+            if self.iface:
+                layer_tree_view = self.iface.layerTreeView()
+                for layer in layers:
+                    layer_tree_view.refreshLayerSymbology(layer.id())
+        except Exception as e:
+            QgsMessageLog.logMessage(
+                tr('apply_style_exception', error=str(e)),
+                self.LOG_TAG,
+                Qgis.Critical,
+            )
+
     def _apply_style_to_layer(self, layer: QgsMapLayer, style_file: str) -> bool:
         """
         Apply style file to a layer.
@@ -141,13 +323,6 @@ class LayerProcessor:
                 )
                 return False
 
-            # Refresh layer display
-            layer.triggerRepaint()
-
-            # Refresh legend in layer panel
-            if self.iface:
-                self.iface.layerTreeView().refreshLayerSymbology(layer.id())
-
             return True
 
         except Exception as e:
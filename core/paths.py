@@ -7,8 +7,10 @@ Provides cross-platform path utilities for storing plugin data.
 
 import os
 import sys
+from functools import lru_cache
 
 
+@lru_cache(maxsize=1)
 def get_autostyle_data_dir() -> str:
     """
     Get the AutoStyle data directory in the user's QGIS configuration directory.
@@ -22,6 +24,8 @@ def get_autostyle_data_dir() -> str:
     - macOS: ~/Library/Application Support/QGIS/QGIS3/AutoStyle
     - Linux: ~/.local/share/QGIS/QGIS3/AutoStyle
 
+    The path is resolved once per session.
+
     :return: Path to the AutoStyle data directory
     """
     if sys.platform == 'win32':
@@ -49,10 +53,13 @@ def get_autostyle_data_dir() -> str:
     return base_dir
 
 
+@lru_cache(maxsize=1)
 def get_styles_dir() -> str:
     """
     Get the styles configuration directory.
 
+    The path is resolved once per session.
+
     :return: Path to the styles directory
     """
     return os.path.join(get_autostyle_data_dir(), 'styles')
@@ -64,5 +71,4 @@ def ensure_dir_exists(dir_path: str) -> None:
 
     :param dir_path: Path to the directory
     """
-    if not os.path.exists(dir_path):
-        os.makedirs(dir_path)
+    os.makedirs(dir_path, exist_ok=True)
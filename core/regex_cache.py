@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""
+Regex Cache Module
+
+Process-wide cache of compiled rule patterns, shared by config validation,
+import and style application so each pattern is compiled only once.
+"""
+
+import re
+from typing import Dict, Pattern
+
+# Maximum number of cached patterns before the cache is reset
+_MAX_CACHE_SIZE = 1024
+
+_COMPILED_CACHE: Dict[str, Pattern] = {}
+
+
+def get_or_compile(pattern: str) -> Pattern:
+    """
+    Get the compiled regex for a pattern, compiling it on first use.
+
+    :param pattern: Regex pattern string
+    :return: Compiled pattern
+    :raises re.error: If the pattern is invalid
+    """
+    regex = _COMPILED_CACHE.get(pattern)
+    if regex is None:
+        regex = re.compile(pattern)
+        if len(_COMPILED_CACHE) >= _MAX_CACHE_SIZE:
+            _COMPILED_CACHE.clear()
+        _COMPILED_CACHE[pattern] = regex
+    return regex
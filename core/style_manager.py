@@ -11,6 +11,31 @@ import re
 from typing import Dict, List, Optional, Tuple
 
 from .i18n import tr
+from .regex_cache import get_or_compile
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Characters not allowed in config filenames, mapped to '_'
+_UNSAFE_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+# Config line format: "pattern": "style_file"
+_LINE_RE = re.compile(r'^"(.+)"\s*:\s*"(.+)"$')
+
+
+def _dumps(data) -> bytes:
+    """
+    Serialize config data to indented UTF-8 JSON bytes.
+
+    Uses orjson when it is installed, otherwise the standard json module.
+
+    :param data: JSON-serializable data
+    :return: Encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
 
 
 class StyleManager:
@@ -27,8 +52,7 @@ class StyleManager:
 
     def _ensure_dir_exists(self):
         """Ensure the styles directory exists."""
-        if not os.path.exists(self.styles_dir):
-            os.makedirs(self.styles_dir)
+        os.makedirs(self.styles_dir, exist_ok=True)
 
     def _get_config_path(self, name: str) -> str:
         """
@@ -47,7 +71,7 @@ class StyleManager:
         :param name: Original name
         :return: Safe filename
         """
-        return re.sub(r'[<>:"/\\|?*]', '_', name)
+        return name.translate(_UNSAFE_TABLE)
 
     def list_configs(self) -> List[str]:
         """
@@ -55,16 +79,16 @@ class StyleManager:
 
         :return: List of config names (derived from filenames)
         """
-        configs = []
-        if not os.path.exists(self.styles_dir):
-            return configs
-
-        for filename in os.listdir(self.styles_dir):
-            if filename.endswith('.json'):
+        try:
+            with os.scandir(self.styles_dir) as entries:
                 # Use filename without extension as config name
-                config_name = filename[:-5]  # Remove '.json'
-                configs.append(config_name)
-        return sorted(configs)
+                return sorted(
+                    entry.name[:-5]  # Remove '.json'
+                    for entry in entries
+                    if entry.name.endswith('.json') and entry.is_file()
+                )
+        except OSError:
+            return []
 
     def load_config(self, name: str) -> Optional[Dict]:
         """
@@ -122,8 +146,8 @@ class StyleManager:
         # Save to file
         config_path = self._get_config_path(name)
         try:
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, ensure_ascii=False, indent=2)
+            with open(config_path, 'wb') as f:
+                f.write(_dumps(config_data))
             return True, ""
         except IOError as e:
             return False, tr('save_config_failed', error=str(e))
@@ -153,27 +177,25 @@ class StyleManager:
         :return: (rules_list, error_message)
         """
         rules = []
-        if not content or not content.strip():
+        if not content:
             return rules, None
 
-        # Match format: "pattern": "style_file"
-        pattern = re.compile(r'^"(.+)"\s*:\s*"(.+)"$')
-
-        for line_num, line in enumerate(content.strip().split('\n'), 1):
-            line = line.strip()
+        for line_num, raw_line in enumerate(content.splitlines(), 1):
+            line = raw_line.strip()
             if not line:
                 continue
 
-            match = pattern.match(line)
+            match = _LINE_RE.match(line)
             if not match:
                 return [], tr('format_error_msg', line=line_num, content=line)
 
             regex_pattern = match.group(1)
             style_file = match.group(2)
 
-            # Validate regex syntax
+            # Validate regex syntax (the compiled pattern stays in the shared
+            # regex cache, so applying the config does not compile it again)
             try:
-                re.compile(regex_pattern)
+                get_or_compile(regex_pattern)
             except re.error as e:
                 return [], tr('regex_syntax_error', row=line_num, error=str(e))
 
@@ -191,12 +213,10 @@ class StyleManager:
         :param config: Config data dict
         :return: Text format content
         """
-        lines = []
-        for rule in config.get('rules', []):
-            pattern = rule.get('pattern', '')
-            style_file = rule.get('style_file', '')
-            lines.append(f'"{pattern}": "{style_file}"')
-        return '\n'.join(lines)
+        return '\n'.join(
+            f'"{rule.get("pattern", "")}": "{rule.get("style_file", "")}"'
+            for rule in config.get('rules', [])
+        )
 
     def export_config(self, name: str, export_path: str) -> Tuple[bool, str]:
         """
@@ -213,8 +233,8 @@ class StyleManager:
         # Only export rules, name is derived from filename
         export_data = {"rules": config.get('rules', [])}
         try:
-            with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, ensure_ascii=False, indent=2)
+            with open(export_path, 'wb') as f:
+                f.write(_dumps(export_data))
             return True, ""
         except IOError as e:
             return False, str(e)
@@ -264,15 +284,15 @@ class StyleManager:
                 return False, tr('invalid_config_format'), ""
             # Validate regex syntax
             try:
-                re.compile(rule['pattern'])
+                get_or_compile(rule['pattern'])
             except re.error as e:
                 return False, tr('regex_syntax_error', row=0, error=str(e)), ""
 
         # Save config (only store rules, name is derived from filename)
         config_data = {"rules": rules}
         try:
-            with open(existing_path, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, ensure_ascii=False, indent=2)
+            with open(existing_path, 'wb') as f:
+                f.write(_dumps(config_data))
             return True, "", name
         except IOError as e:
             return False, str(e), ""
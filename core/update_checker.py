@@ -6,18 +6,31 @@ Provides automatic update checking functionality for the plugin.
 Supports checking latest version from remote server and notifying user.
 """
 
+import gzip
+import http.client
 import json
 import os
 import re
 import threading
+import time
+from concurrent.futures import Future
+from dataclasses import asdict
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import zip_longest
 from typing import Callable
 from typing import Optional
+from urllib.error import HTTPError
 from urllib.error import URLError
-from urllib.request import Request
-from urllib.request import urlopen
+from urllib.parse import urlsplit
+from urllib.request import Request, getproxies, proxy_bypass, urlopen
 
 from qgis.core import Qgis
 from qgis.core import QgsMessageLog
+from qgis.PyQt.QtCore import QRunnable
+from qgis.PyQt.QtCore import QThreadPool
+
+from .paths import get_autostyle_data_dir
 
 # Default update check URL (GitHub raw content as example)
 # Users should replace this with their actual update server URL
@@ -29,7 +42,59 @@ REQUEST_TIMEOUT = 10
 # Log tag
 LOG_TAG = "AutoStyle"
 
+# File (in the AutoStyle data directory) caching update responses
+UPDATE_CACHE_FILENAME = "update_cache.json"
+
+# Backoff after failed checks: base * factor ** failures, capped (seconds)
+BACKOFF_BASE_SECONDS = 60
+BACKOFF_FACTOR = 2
+BACKOFF_MAX_SECONDS = 24 * 60 * 60
+
+# A successful check result is reused for this long (seconds)
+UPDATE_CACHE_MAX_AGE = 6 * 60 * 60
+
+# Upper bound for the (decompressed) version response body in bytes
+MAX_RESPONSE_BYTES = 1024 * 1024
+
+# Leading numeric part of a version string (e.g. "1.2.3" in "1.2.3-beta")
+_VERSION_RE = re.compile(r'^(\d+(?:\.\d+)*)')
+
+# "version=..." line in metadata.txt
+_METADATA_VERSION_RE = re.compile(br'^version\s*=\s*([^\r\n]+)', re.MULTILINE)
+
+# Current version per plugin directory (metadata.txt does not change at runtime)
+_VERSION_CACHE = {}
+
+# Minimum seconds between two log entries for the same kind of failure
+LOG_THROTTLE_SECONDS = 60 * 60
 
+# Last log time (time.monotonic) per throttle key
+_LAST_LOGGED = {}
+
+
+def _log_throttled(
+    key: str,
+    message: str,
+    level=Qgis.Warning,
+    interval: float = LOG_THROTTLE_SECONDS,
+) -> None:
+    """
+    Log a message unless one with the same key was logged within interval.
+
+    :param key: Throttle key identifying the kind of message
+    :param message: Message text
+    :param level: Qgis message level
+    :param interval: Minimum seconds between messages with this key
+    """
+    now = time.monotonic()
+    last = _LAST_LOGGED.get(key)
+    if last is not None and now - last < interval:
+        return
+    _LAST_LOGGED[key] = now
+    QgsMessageLog.logMessage(message, LOG_TAG, level)
+
+
+@lru_cache(maxsize=64)
 def parse_version(version_str: str) -> tuple:
     """
     Parse version string to comparable tuple.
@@ -43,7 +108,7 @@ def parse_version(version_str: str) -> tuple:
     version_str = version_str.lstrip('vV')
 
     # Extract numeric parts
-    match = re.match(r'^(\d+(?:\.\d+)*)', version_str)
+    match = _VERSION_RE.match(version_str)
     if not match:
         return (0,)
 
@@ -59,53 +124,62 @@ def compare_versions(version1: str, version2: str) -> int:
     :param version2: Second version string
     :return: 1 if version1 > version2, -1 if version1 < version2, 0 if equal
     """
-    v1 = parse_version(version1)
-    v2 = parse_version(version2)
+    # Missing trailing components count as zero (1.0 == 1.0.0)
+    for a, b in zip_longest(parse_version(version1), parse_version(version2), fillvalue=0):
+        if a != b:
+            return 1 if a > b else -1
+    return 0
 
-    # Pad shorter version with zeros
-    max_len = max(len(v1), len(v2))
-    v1 = v1 + (0,) * (max_len - len(v1))
-    v2 = v2 + (0,) * (max_len - len(v2))
 
-    if v1 > v2:
-        return 1
-    elif v1 < v2:
-        return -1
-    else:
-        return 0
+class CaptivePortalError(URLError):
+    """The server answered with an HTML page instead of version data."""
 
 
+@dataclass(frozen=True)
 class UpdateInfo:
-    """Update information container."""
+    """
+    Update information container.
+
+    :param has_update: Whether there is a new version available
+    :param current_version: Current installed version
+    :param latest_version: Latest available version
+    :param download_url: URL to download the latest version
+    :param changelog: Changelog/release notes
+    :param release_date: Release date of latest version
+    :param error: Error message if check failed
+    """
 
-    def __init__(
-        self,
-        has_update: bool = False,
-        current_version: str = "",
-        latest_version: str = "",
-        download_url: str = "",
-        changelog: str = "",
-        release_date: str = "",
-        error: Optional[str] = None,
-    ):
+    has_update: bool = False
+    current_version: str = ""
+    latest_version: str = ""
+    download_url: str = ""
+    changelog: str = ""
+    release_date: str = ""
+    error: Optional[str] = None
+
+
+class _CheckRunnable(QRunnable):
+    """Runs an update check on Qt's global thread pool and completes a Future."""
+
+    def __init__(self, future: Future, check: Callable[[], UpdateInfo]):
         """
-        Initialize update info.
+        Initialize the runnable.
 
-        :param has_update: Whether there is a new version available
-        :param current_version: Current installed version
-        :param latest_version: Latest available version
-        :param download_url: URL to download the latest version
-        :param changelog: Changelog/release notes
-        :param release_date: Release date of latest version
-        :param error: Error message if check failed
+        :param future: Future to complete with the check result
+        :param check: Function performing the check
         """
-        self.has_update = has_update
-        self.current_version = current_version
-        self.latest_version = latest_version
-        self.download_url = download_url
-        self.changelog = changelog
-        self.release_date = release_date
-        self.error = error
+        super().__init__()
+        self.future = future
+        self.check = check
+
+    def run(self):
+        """Run the check unless the future was cancelled while queued."""
+        if not self.future.set_running_or_notify_cancel():
+            return
+        try:
+            self.future.set_result(self.check())
+        except BaseException as e:
+            self.future.set_exception(e)
 
 
 class UpdateChecker:
@@ -120,16 +194,30 @@ class UpdateChecker:
         self,
         plugin_dir: str,
         version_url: str = DEFAULT_VERSION_URL,
+        use_head_preflight: bool = False,
     ):
         """
         Initialize the update checker.
 
         :param plugin_dir: Plugin directory path (to read metadata.txt)
         :param version_url: URL to fetch version information JSON
+        :param use_head_preflight: Send a HEAD request first and skip the GET
+            when the validators match the cache (for servers that do not
+            honour If-None-Match)
         """
         self.plugin_dir = plugin_dir
         self.version_url = version_url
+        self.use_head_preflight = use_head_preflight
+        self.cache_path = os.path.join(get_autostyle_data_dir(), UPDATE_CACHE_FILENAME)
         self._current_version = None
+        self._inflight = None
+        self._inflight_lock = threading.Lock()
+        # Persistent connection; _conn_busy is set while a check uses it, so
+        # close() from another thread defers to the end of that request
+        self._conn = None
+        self._conn_lock = threading.Lock()
+        self._conn_busy = False
+        self._close_requested = False
 
     def get_current_version(self) -> str:
         """
@@ -140,15 +228,20 @@ class UpdateChecker:
         if self._current_version is not None:
             return self._current_version
 
+        version = _VERSION_CACHE.get(self.plugin_dir)
+        if version is not None:
+            self._current_version = version
+            return version
+
         metadata_path = os.path.join(self.plugin_dir, "metadata.txt")
         version = "0.0.0"
 
         try:
-            with open(metadata_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    if line.startswith("version="):
-                        version = line.split("=", 1)[1].strip()
-                        break
+            with open(metadata_path, "rb") as f:
+                match = _METADATA_VERSION_RE.search(f.read())
+            if match:
+                version = match.group(1).decode("utf-8").strip()
+            _VERSION_CACHE[self.plugin_dir] = version
         except Exception as e:
             QgsMessageLog.logMessage(
                 f"Failed to read metadata.txt: {e}",
@@ -159,61 +252,427 @@ class UpdateChecker:
         self._current_version = version
         return version
 
-    def _fetch_remote_version(self) -> dict:
+    def _load_cache(self) -> dict:
+        """
+        Load the cached response entry for the current version URL.
+
+        An entry with fields of the wrong type (e.g. a hand-edited or
+        corrupted file) is discarded.
+
+        :return: Cache entry dict (empty if none)
+        """
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        entry = cache.get(self.version_url) if isinstance(cache, dict) else None
+        if not isinstance(entry, dict):
+            return {}
+        return entry if self._is_valid_cache_entry(entry) else {}
+
+    @staticmethod
+    def _is_valid_cache_entry(entry: dict) -> bool:
+        """
+        Check the field types of a cache entry.
+
+        :param entry: Cache entry dict
+        :return: True if all known fields have the expected type
+        """
+        for key in ("checked_at", "next_check_at"):
+            value = entry.get(key, 0)
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                return False
+        failures = entry.get("failures", 0)
+        if isinstance(failures, bool) or not isinstance(failures, int) or failures < 0:
+            return False
+        for key in ("etag", "last_modified", "body"):
+            if not isinstance(entry.get(key), (str, type(None))):
+                return False
+        return isinstance(entry.get("update_info"), (dict, type(None)))
+
+    def _save_cache(self, entry: Optional[dict]) -> None:
+        """
+        Store (or remove, if entry is None) the cache entry for the current
+        version URL. The file is replaced atomically.
+
+        :param entry: Cache entry dict, or None to evict
+        """
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+            if not isinstance(cache, dict):
+                cache = {}
+        except (OSError, ValueError):
+            cache = {}
+
+        if entry is None:
+            cache.pop(self.version_url, None)
+        else:
+            cache[self.version_url] = entry
+
+        tmp_path = self.cache_path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            QgsMessageLog.logMessage(
+                f"Failed to write update cache: {e}",
+                LOG_TAG,
+                Qgis.Warning,
+            )
+
+    def _update_cache(self, **fields) -> None:
+        """
+        Merge fields into the cache entry for the current version URL.
+
+        :param fields: Entry fields to set
+        """
+        entry = self._load_cache()
+        entry.update(fields)
+        self._save_cache(entry)
+
+    def close(self) -> None:
+        """
+        Close the persistent connection to the update server, if any.
+
+        Safe to call from any thread: if a check is using the connection, it
+        is closed when that request has finished.
+        """
+        with self._conn_lock:
+            if self._conn_busy:
+                self._close_requested = True
+                return
+            conn, self._conn = self._conn, None
+        if conn is not None:
+            conn.close()
+
+    def _drop_connection(self) -> None:
+        """Close the persistent connection from the thread using it."""
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            conn.close()
+
+    def _acquire_connection(self) -> None:
+        """Mark the persistent connection as used by the current check."""
+        with self._conn_lock:
+            self._conn_busy = True
+
+    def _release_connection(self) -> None:
+        """End the current check's use of the connection, closing it if asked."""
+        with self._conn_lock:
+            self._conn_busy = False
+            close, self._close_requested = self._close_requested, False
+        if close:
+            self.close()
+
+    def _use_direct_connection(self, parts) -> bool:
+        """
+        Check whether the version URL can use the persistent connection.
+
+        Proxied hosts and URLs with credentials go through urlopen, which
+        handles proxy settings (environment and OS) and such URLs.
+
+        :param parts: urlsplit() result of the version URL
+        :return: True for plain http(s) URLs reached without a proxy
+        """
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            return False
+        if parts.username or parts.password:
+            return False
+        if not getproxies().get(parts.scheme):
+            return True
+        return bool(proxy_bypass(parts.hostname))
+
+    def _open(self, method: str, headers: dict):
+        """
+        Send a request for the version URL over a persistent connection.
+
+        The connection is kept open between checks so later requests skip
+        the TCP/TLS handshake; a connection dropped by the server is
+        re-opened once. Redirects, proxied hosts and non-HTTP URLs go through
+        urlopen. The response body must be read completely before the next
+        request, and the caller must hold the connection (see
+        _acquire_connection).
+
+        :param method: HTTP method
+        :param headers: Request headers
+        :return: Response object (usable as a context manager)
+        :raises: HTTPError for non-2xx responses, URLError on network failure
+        """
+        parts = urlsplit(self.version_url)
+        if not self._use_direct_connection(parts):
+            return urlopen(
+                Request(self.version_url, headers=headers, method=method),
+                timeout=REQUEST_TIMEOUT,
+            )
+
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        for attempt in range(2):
+            if self._conn is None:
+                conn_class = (
+                    http.client.HTTPSConnection if parts.scheme == "https"
+                    else http.client.HTTPConnection
+                )
+                self._conn = conn_class(
+                    parts.hostname, parts.port, timeout=REQUEST_TIMEOUT
+                )
+            try:
+                self._conn.request(method, path, headers=headers)
+                response = self._conn.getresponse()
+                break
+            except (ConnectionError, http.client.HTTPException) as e:
+                # Stale keep-alive connection: reconnect and retry once
+                self._drop_connection()
+                if attempt:
+                    raise URLError(e)
+            except OSError as e:
+                self._drop_connection()
+                raise URLError(e)
+
+        if response.status < 300:
+            return response
+
+        # Drain a bounded error body to keep the connection reusable; if more
+        # is left, drop the connection instead of reading it
+        response.read(MAX_RESPONSE_BYTES)
+        if not response.isclosed():
+            self._drop_connection()
+        if response.status != 304 and response.getheader("Location"):
+            return urlopen(
+                Request(self.version_url, headers=headers, method=method),
+                timeout=REQUEST_TIMEOUT,
+            )
+        raise HTTPError(
+            self.version_url, response.status, response.reason, response.headers, None
+        )
+
+    def _request_headers(self) -> dict:
+        """
+        Get the headers sent with every version request.
+
+        :return: Request headers
+        """
+        return {
+            "User-Agent": f"AutoStyle/{self.get_current_version()}",
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip",
+        }
+
+    def _head_matches_cache(self, cached: dict) -> bool:
+        """
+        Check with a HEAD request whether the remote file is unchanged.
+
+        :param cached: Cache entry for the current version URL
+        :return: True if the returned ETag/Last-Modified match the cache
+        :raises: URLError on network failure
+        """
+        # Same headers as the GET, so validators that vary by encoding match
+        try:
+            with self._open("HEAD", self._request_headers()) as response:
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+        except HTTPError:
+            # HEAD not supported: let the GET decide
+            return False
+
+        if etag and cached.get("etag"):
+            return etag == cached["etag"]
+        if last_modified and cached.get("last_modified"):
+            return last_modified == cached["last_modified"]
+        return False
+
+    def _fetch_remote_version(self, conditional: bool = True) -> dict:
         """
         Fetch version information from remote server.
 
+        Sends If-None-Match / If-Modified-Since with the cached ETag and
+        Last-Modified values so an unchanged file is answered with
+        304 Not Modified and served from the local cache.
+
+        :param conditional: Whether to send cache validators
         :return: Parsed JSON data or empty dict on error
-        :raises: URLError, ValueError on failure
-        """
-        request = Request(
-            self.version_url,
-            headers={
-                "User-Agent": f"AutoStyle/{self.get_current_version()}",
-                "Accept": "application/json",
-            },
+        :raises: URLError (CaptivePortalError for HTML responses),
+            ValueError on failure
+        """
+        cached = self._load_cache() if conditional else {}
+        if (
+            self.use_head_preflight
+            and cached.get("body") is not None
+            and self._head_matches_cache(cached)
+        ):
+            return json.loads(cached["body"])
+
+        headers = self._request_headers()
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+        try:
+            with self._open("GET", headers) as response:
+                # Captive portals answer with a login page; don't parse it.
+                # (GitHub raw serves JSON as text/plain, so only HTML is rejected.)
+                content_type = response.headers.get_content_type()
+                if content_type in ("text/html", "application/xhtml+xml"):
+                    self._drop_connection()
+                    raise CaptivePortalError(f"unexpected content type {content_type}")
+
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                body = response
+                if response.headers.get("Content-Encoding") == "gzip":
+                    body = gzip.GzipFile(fileobj=response)
+                raw = body.read(MAX_RESPONSE_BYTES + 1)
+                if len(raw) > MAX_RESPONSE_BYTES:
+                    self._drop_connection()
+                    raise ValueError(f"Response larger than {MAX_RESPONSE_BYTES} bytes")
+                if not (etag or last_modified):
+                    # Nothing to cache
+                    return json.loads(raw)
+                data = raw.decode("utf-8")
+        except HTTPError as e:
+            if e.code != 304 or not conditional:
+                raise
+            if cached.get("body") is not None:
+                return json.loads(cached["body"])
+            # 304 without a stored body: drop the entry and fetch unconditionally
+            self._save_cache(None)
+            return self._fetch_remote_version(conditional=False)
+
+        remote_data = json.loads(data)
+        self._update_cache(etag=etag, last_modified=last_modified, body=data)
+        return remote_data
+
+    def _build_update_info(self, remote_data: dict, current_version: str) -> UpdateInfo:
+        """
+        Build update info from remote version data.
+
+        :param remote_data: Parsed version.json content
+        :param current_version: Current installed version
+        :return: UpdateInfo object
+        """
+        latest_version = remote_data.get("version", "")
+        if not latest_version:
+            return UpdateInfo(
+                has_update=False,
+                current_version=current_version,
+                error="Invalid version data from server",
+            )
+
+        has_update = compare_versions(latest_version, current_version) > 0
+
+        return UpdateInfo(
+            has_update=has_update,
+            current_version=current_version,
+            latest_version=latest_version,
+            download_url=remote_data.get("download_url", ""),
+            changelog=remote_data.get("changelog", ""),
+            release_date=remote_data.get("release_date", ""),
         )
 
-        with urlopen(request, timeout=REQUEST_TIMEOUT) as response:
-            data = response.read().decode("utf-8")
-            return json.loads(data)
+    def _cached_update_info(self, cached: dict, current_version: str) -> Optional[UpdateInfo]:
+        """
+        Build the last known result from a cache entry.
 
-    def check_update(self) -> UpdateInfo:
+        :param cached: Cache entry dict
+        :param current_version: Installed plugin version
+        :return: UpdateInfo from the cached response, or None if there is none
+        """
+        if cached.get("body") is not None:
+            try:
+                return self._build_update_info(json.loads(cached["body"]), current_version)
+            except ValueError:
+                pass
+        cached_info = cached.get("update_info")
+        if isinstance(cached_info, dict) and cached_info.get("current_version") == current_version:
+            try:
+                return UpdateInfo(**cached_info)
+            except TypeError:
+                pass
+        return None
+
+    def check_update(self, max_age: float = UPDATE_CACHE_MAX_AGE) -> UpdateInfo:
         """
         Check for updates synchronously.
 
+        A successful result younger than max_age is returned from the cache
+        without any network request. After network failures, further automatic
+        requests are skipped with exponential backoff; during that window the
+        last cached response (if any) is used.
+
+        :param max_age: Maximum age in seconds of a reusable cached result
+            (0 always queries the server, ignoring the backoff)
         :return: UpdateInfo object with check results
         """
         current_version = self.get_current_version()
 
-        try:
-            remote_data = self._fetch_remote_version()
-
-            latest_version = remote_data.get("version", "")
-            if not latest_version:
-                return UpdateInfo(
-                    has_update=False,
-                    current_version=current_version,
-                    error="Invalid version data from server",
-                )
-
-            has_update = compare_versions(latest_version, current_version) > 0
+        cached = self._load_cache()
+        now = time.time()
+
+        cached_info = cached.get("update_info")
+        if (
+            isinstance(cached_info, dict)
+            and cached_info.get("current_version") == current_version
+            and now - cached.get("checked_at", 0) < max_age
+        ):
+            try:
+                return UpdateInfo(**cached_info)
+            except TypeError:
+                pass
+
+        # Manual checks (max_age=0) always contact the server
+        if max_age > 0 and now < cached.get("next_check_at", 0):
+            update_info = self._cached_update_info(cached, current_version)
+            if update_info is not None:
+                return update_info
+            return UpdateInfo(
+                has_update=False,
+                current_version=current_version,
+                error="Network error: update server unavailable, retry later",
+            )
 
+        try:
+            self._acquire_connection()
+            try:
+                remote_data = self._fetch_remote_version()
+            finally:
+                self._release_connection()
+            update_info = self._build_update_info(remote_data, current_version)
+
+            fields = {}
+            if cached.get("failures"):
+                fields.update(failures=0, next_check_at=0)
+            if not update_info.error:
+                fields.update(checked_at=now, update_info=asdict(update_info))
+            if fields:
+                self._update_cache(**fields)
+            return update_info
+
+        except CaptivePortalError as e:
+            # Not a server failure: the network (hotel Wi-Fi, proxy login)
+            # intercepted the request, so keep the last result and no backoff
+            _log_throttled("portal_error", f"Update check intercepted: {e}")
+            update_info = self._cached_update_info(cached, current_version)
+            if update_info is not None:
+                return update_info
             return UpdateInfo(
-                has_update=has_update,
+                has_update=False,
                 current_version=current_version,
-                latest_version=latest_version,
-                download_url=remote_data.get("download_url", ""),
-                changelog=remote_data.get("changelog", ""),
-                release_date=remote_data.get("release_date", ""),
+                error=f"Network error: {e.reason}",
             )
 
         except URLError as e:
-            QgsMessageLog.logMessage(
-                f"Network error while checking update: {e}",
-                LOG_TAG,
-                Qgis.Warning,
-            )
+            failures = cached.get("failures", 0)
+            delay = min(BACKOFF_BASE_SECONDS * BACKOFF_FACTOR ** failures, BACKOFF_MAX_SECONDS)
+            self._update_cache(failures=failures + 1, next_check_at=now + delay)
+            _log_throttled("net_error", f"Network error while checking update: {e}")
             return UpdateInfo(
                 has_update=False,
                 current_version=current_version,
@@ -221,11 +680,10 @@ class UpdateChecker:
             )
 
         except json.JSONDecodeError as e:
-            QgsMessageLog.logMessage(
-                f"Invalid JSON response: {e}",
-                LOG_TAG,
-                Qgis.Warning,
-            )
+            _log_throttled("json_error", f"Invalid JSON response: {e}")
+            update_info = self._cached_update_info(cached, current_version)
+            if update_info is not None:
+                return update_info
             return UpdateInfo(
                 has_update=False,
                 current_version=current_version,
@@ -233,29 +691,62 @@ class UpdateChecker:
             )
 
         except Exception as e:
-            QgsMessageLog.logMessage(
-                f"Update check failed: {e}",
-                LOG_TAG,
-                Qgis.Warning,
-            )
+            _log_throttled("generic_error", f"Update check failed: {e}")
             return UpdateInfo(
                 has_update=False,
                 current_version=current_version,
                 error=str(e),
             )
 
-    def check_update_async(self, callback: Callable[[UpdateInfo], None]) -> None:
+    def check_update_async(
+        self,
+        callback: Callable[[UpdateInfo], None],
+        max_age: float = UPDATE_CACHE_MAX_AGE,
+    ) -> Future:
         """
         Check for updates asynchronously.
 
-        The callback will be called from a background thread.
-        Use Qt signals/slots to safely update UI from the callback.
+        The check runs on Qt's global thread pool and the callback is called
+        from that pool thread. Use Qt signals/slots to safely update UI from the
+        callback. Calls made while a check is still running share its result
+        instead of starting another request.
 
         :param callback: Function to call with UpdateInfo when check completes
+        :param max_age: Maximum age in seconds of a reusable cached result
+        :return: Future of the check, can be cancelled while still pending
         """
-        def _check_thread():
-            result = self.check_update()
-            callback(result)
+        def _on_done(future: Future):
+            if future.cancelled():
+                return
+            try:
+                update_info = future.result()
+            except Exception as e:
+                update_info = UpdateInfo(
+                    has_update=False,
+                    current_version=self.get_current_version(),
+                    error=str(e),
+                )
+            callback(update_info)
+
+        with self._inflight_lock:
+            future = self._inflight
+            if future is None or future.done():
+                future = Future()
+                self._inflight = future
+                future.add_done_callback(self._clear_inflight)
+                QThreadPool.globalInstance().start(
+                    _CheckRunnable(future, lambda: self.check_update(max_age))
+                )
+
+        future.add_done_callback(_on_done)
+        return future
 
-        thread = threading.Thread(target=_check_thread, daemon=True)
-        thread.start()
+    def _clear_inflight(self, future: Future) -> None:
+        """
+        Forget the in-flight check once it has finished.
+
+        :param future: Finished check future
+        """
+        with self._inflight_lock:
+            if self._inflight is future:
+                self._inflight = None
@@ -65,7 +65,9 @@ mkdir -p "$TEMP_PLUGIN_DIR/core"
 cp "$PLUGIN_DIR/core/__init__.py" "$TEMP_PLUGIN_DIR/core/"
 cp "$PLUGIN_DIR/core/style_manager.py" "$TEMP_PLUGIN_DIR/core/"
 cp "$PLUGIN_DIR/core/layer_processor.py" "$TEMP_PLUGIN_DIR/core/"
+cp "$PLUGIN_DIR/core/regex_cache.py" "$TEMP_PLUGIN_DIR/core/"
 cp "$PLUGIN_DIR/core/i18n.py" "$TEMP_PLUGIN_DIR/core/"
+cp "$PLUGIN_DIR/core/_help_content.py" "$TEMP_PLUGIN_DIR/core/"
 cp "$PLUGIN_DIR/core/update_checker.py" "$TEMP_PLUGIN_DIR/core/"
 
 # Copy ui module
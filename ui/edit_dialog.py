@@ -5,12 +5,29 @@ Style Config Edit Dialog
 Provides dialog interface for adding and editing style configs.
 """
 
-from typing import Dict, List, Optional
-
-from qgis.PyQt.QtCore import QRect, QSize, Qt
-from qgis.PyQt.QtGui import QColor, QFontMetrics, QPainter, QTextFormat
+import re
+from functools import partial
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from qgis.core import QgsApplication
+from qgis.PyQt import sip
+from qgis.PyQt.QtCore import (
+    QAbstractTableModel,
+    QEvent,
+    QModelIndex,
+    QObject,
+    QPersistentModelIndex,
+    QRect,
+    QRunnable,
+    QSize,
+    Qt,
+    QThreadPool,
+    pyqtSignal,
+)
+from qgis.PyQt.QtGui import QBrush, QColor, QFontMetrics, QPainter, QTextFormat
 from qgis.PyQt.QtWidgets import (
     QAbstractItemView,
+    QAction,
     QDialog,
     QFileDialog,
     QGroupBox,
@@ -24,13 +41,14 @@ from qgis.PyQt.QtWidgets import (
     QSizePolicy,
     QStackedWidget,
     QStyledItemDelegate,
-    QTableWidget,
-    QTableWidgetItem,
+    QStyleOptionViewItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
 from ..core.i18n import tr
+from ..core.regex_cache import get_or_compile
 
 # Button size constants (consistent with main panel)
 BUTTON_MIN_WIDTH = 70
@@ -89,12 +107,12 @@ MIN_DIALOG_HEIGHT = 400
 
 # Table style
 TABLE_STYLE = """
-    QTableWidget {
+    QTableView {
         border: 1px solid #C0C0C0;
         gridline-color: #E0E0E0;
         background-color: white;
     }
-    QTableWidget::item {
+    QTableView::item {
         padding: 2px 4px;
     }
     QHeaderView::section {
@@ -148,24 +166,11 @@ TOGGLE_BUTTON_STYLE = """
 EDIT_MODE_TABLE = 0
 EDIT_MODE_TEXT = 1
 
-# Browse button style
-BROWSE_BUTTON_STYLE = """
-    QPushButton {
-        background-color: #F0F0F0;
-        border: 1px solid #C0C0C0;
-        border-radius: 2px;
-        padding: 0px 4px;
-        min-width: 24px;
-        max-width: 24px;
-    }
-    QPushButton:hover {
-        background-color: #E5E5E5;
-        border: 1px solid #A0A0A0;
-    }
-    QPushButton:pressed {
-        background-color: #D0D0D0;
-    }
-"""
+# Rule count from which regex validation runs on a worker thread
+ASYNC_VALIDATION_MIN_RULES = 200
+
+# Text mode line format: "pattern": "style_file"
+_LINE_RE = re.compile(r'^"(.+)"\s*:\s*"(.+)"$')
 
 # Line number area style constants
 LINE_NUMBER_BG_COLOR = QColor('#F5F5F5')
@@ -284,62 +289,88 @@ class LineNumberedPlainTextEdit(QPlainTextEdit):
             block_number += 1
 
 
-class StyleFileDelegate(QStyledItemDelegate):
+class RuleItemDelegate(QStyledItemDelegate):
+    """
+    Delegate for rule cells.
+
+    Rule cells only carry text, so the style option is filled from a single
+    DisplayRole lookup instead of querying every item role (font, alignment,
+    colors, check state, decoration, ...) on each paint.
+    """
+
+    def initStyleOption(self, option, index):
+        """Initialize the style option from the cell text."""
+        option.index = index
+        text = index.data(Qt.DisplayRole)
+        if text:
+            option.features |= QStyleOptionViewItem.HasDisplay
+            option.text = text
+        option.backgroundBrush = QBrush()
+        option.styleObject = None
+
+
+class StyleFileDelegate(RuleItemDelegate):
     """Custom delegate for style file path column with file browser button."""
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Translated once per dialog, reused for every editor and click
+        self._browse_title = tr('select_style_file_title')
+        self._file_filter = tr('style_file_filter')
 
     def createEditor(self, parent, option, index):
-        """Create editor widget."""
-        # Create container
-        container = QWidget(parent)
-        layout = QHBoxLayout(container)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(2)
-
-        # Text input
-        line_edit = QLineEdit(container)
+        """Create editor widget (line edit with a trailing browse action)."""
+        line_edit = QLineEdit(parent)
         line_edit.setFrame(False)
-        layout.addWidget(line_edit)
-
-        # Browse button
-        browse_btn = QPushButton("...", container)
-        browse_btn.setStyleSheet(BROWSE_BUTTON_STYLE)
-        browse_btn.setFixedSize(24, 20)
-        browse_btn.clicked.connect(lambda: self._on_browse_clicked(line_edit, container))
-        layout.addWidget(browse_btn)
 
-        # Save references for later access
-        container.line_edit = line_edit
-        container.browse_btn = browse_btn
+        browse_action = QAction(
+            QgsApplication.getThemeIcon('/mActionFileOpen.svg'),
+            self._browse_title,
+            line_edit,
+        )
+        browse_action.triggered.connect(
+            partial(self._on_browse_clicked, line_edit, QPersistentModelIndex(index))
+        )
+        line_edit.addAction(browse_action, QLineEdit.TrailingPosition)
 
-        return container
+        return line_edit
 
-    def _on_browse_clicked(self, line_edit: QLineEdit, container: QWidget):
-        """Browse button click event."""
+    def _on_browse_clicked(
+        self,
+        line_edit: QLineEdit,
+        index: QPersistentModelIndex,
+        _checked: bool = False,
+    ):
+        """Browse action triggered event (_checked is the triggered() argument)."""
         current_path = line_edit.text()
 
+        # Parent the file dialog to the view: the editor may be destroyed
+        # while the dialog is open
         file_path, __ = QFileDialog.getOpenFileName(
-            container,
-            tr('select_style_file_title'),
+            self.parent(),
+            self._browse_title,
             current_path,
-            tr('style_file_filter'),
+            self._file_filter,
         )
 
         if file_path:
-            line_edit.setText(file_path)
+            # The file dialog takes focus, which commits and closes the
+            # editor, so store the chosen path in the model directly
+            if index.isValid():
+                index.model().setData(QModelIndex(index), file_path, Qt.EditRole)
+            if not sip.isdeleted(line_edit):
+                line_edit.setText(file_path)
 
     def setEditorData(self, editor, index):
         """Set editor data."""
         value = index.model().data(index, Qt.EditRole)
         if value is None:
             value = ''
-        editor.line_edit.setText(str(value))
+        editor.setText(str(value))
 
     def setModelData(self, editor, model, index):
         """Save editor data to model."""
-        value = editor.line_edit.text()
+        value = editor.text()
         model.setData(index, value, Qt.EditRole)
 
     def updateEditorGeometry(self, editor, option, index):
@@ -347,6 +378,179 @@ class StyleFileDelegate(QStyledItemDelegate):
         editor.setGeometry(option.rect)
 
 
+class RulesModel(QAbstractTableModel):
+    """Table model holding style rules as [pattern, style_file] rows."""
+
+    COLUMN_COUNT = 2
+
+    def __init__(self, headers: List[str], parent=None):
+        """
+        Initialize the rules model.
+
+        :param headers: Horizontal header labels (pattern, style file)
+        :param parent: Parent object
+        """
+        super().__init__(parent)
+        self._headers = headers
+        self._rows: List[List[str]] = []
+
+    @property
+    def rows(self) -> List[List[str]]:
+        """Row data (read-only view; modify through the model methods)."""
+        return self._rows
+
+    def iter_rules(self, skip_empty: bool = True) -> Iterator[Dict]:
+        """
+        Iterate rows as rule dicts with stripped values.
+
+        :param skip_empty: Skip rows where both pattern and style file are empty
+        :return: Iterator of {'pattern', 'style_file'} dicts
+        """
+        for pattern, style_file in self._rows:
+            pattern = pattern.strip()
+            style_file = style_file.strip()
+            if skip_empty and not pattern and not style_file:
+                continue
+            yield {'pattern': pattern, 'style_file': style_file}
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Return the number of rules."""
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        """Return the number of columns."""
+        return 0 if parent.isValid() else self.COLUMN_COUNT
+
+    def data(self, index, role=Qt.DisplayRole):
+        """Return cell text for display and edit roles."""
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        return self._rows[index.row()][index.column()]
+
+    def setData(self, index, value, role=Qt.EditRole) -> bool:
+        """Store edited cell text."""
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        self._rows[index.row()][index.column()] = '' if value is None else str(value)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+    def flags(self, index):
+        """All cells are editable."""
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEditable | Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Return column titles; rows are numbered from 1."""
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def load(self, rules: List[Dict]):
+        """
+        Replace all rows with the given rules in a single model reset.
+
+        An empty rules list leaves one empty row for editing.
+
+        :param rules: Rules list
+        """
+        self.beginResetModel()
+        self._rows = [
+            [rule.get('pattern', ''), rule.get('style_file', '')]
+            for rule in rules
+        ] or [['', '']]
+        self.endResetModel()
+
+    def insert_row(self, row: int):
+        """
+        Insert an empty row.
+
+        :param row: Row index to insert at
+        """
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.insert(row, ['', ''])
+        self.endInsertRows()
+
+    def remove_rows(self, rows):
+        """
+        Remove rows, one model notification per contiguous run.
+
+        :param rows: Row indexes to remove (any order, no duplicates)
+        """
+        # Walk from the end so earlier indexes stay valid
+        rows = sorted(rows, reverse=True)
+        i = 0
+        while i < len(rows):
+            run_end = run_start = rows[i]
+            i += 1
+            while i < len(rows) and rows[i] == run_start - 1:
+                run_start = rows[i]
+                i += 1
+            self.beginRemoveRows(QModelIndex(), run_start, run_end)
+            del self._rows[run_start:run_end + 1]
+            self.endRemoveRows()
+
+    def move_row(self, src: int, dst: int) -> bool:
+        """
+        Move a row so that it ends up at index dst.
+
+        :param src: Current row index
+        :param dst: Target row index
+        :return: True if the row was moved
+        """
+        if src == dst:
+            return False
+        # Qt expects the destination as the index *before* removal
+        dest_child = dst + 1 if dst > src else dst
+        if not self.beginMoveRows(QModelIndex(), src, src, QModelIndex(), dest_child):
+            return False
+        self._rows.insert(dst, self._rows.pop(src))
+        self.endMoveRows()
+        return True
+
+
+def _first_invalid_pattern(patterns: List[str]) -> Tuple[int, str]:
+    """
+    Find the first pattern that is not a valid regex.
+
+    :param patterns: Patterns to check (empty ones are skipped)
+    :return: (index, error message), or (-1, '') if all are valid
+    """
+    for i, pattern in enumerate(patterns):
+        if pattern:
+            try:
+                get_or_compile(pattern)
+            except re.error as e:
+                return i, str(e)
+    return -1, ''
+
+
+class _ValidationSignals(QObject):
+    """Delivers a validation result from the worker thread to the dialog."""
+
+    finished = pyqtSignal(int, str)
+
+
+class _PatternValidationTask(QRunnable):
+    """Validates rule patterns on Qt's global thread pool."""
+
+    def __init__(self, patterns: List[str], signals: _ValidationSignals):
+        """
+        Initialize the task.
+
+        :param patterns: Patterns to validate
+        :param signals: Signal object emitting (index, error) when done
+        """
+        super().__init__()
+        self.patterns = patterns
+        self.signals = signals
+
+    def run(self):
+        """Validate the patterns and report the first invalid one."""
+        self.signals.finished.emit(*_first_invalid_pattern(self.patterns))
+
+
 class EditDialog(QDialog):
     """Style config edit dialog."""
 
@@ -363,6 +567,18 @@ class EditDialog(QDialog):
         self.config = config
         self.is_edit_mode = config is not None
         self.old_name = config.get('name', '') if config else ''
+        self._pending_save = None
+        self._warn_box = None
+
+        # Receives async validation results; owned by the dialog so it outlives
+        # the auto-deleted worker task until the queued result is delivered
+        self._validation_signals = _ValidationSignals(self)
+        self._validation_signals.finished.connect(self._on_async_patterns_validated)
+
+        # Rules and generated text when text mode was entered, to skip
+        # re-parsing if the text is switched back unchanged
+        self._text_mode_src_rules = None
+        self._text_mode_src_text = None
 
         self._setup_ui()
         self._load_config()
@@ -460,12 +676,13 @@ class EditDialog(QDialog):
         self.edit_stack.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
         # Rules table (index 0)
-        self.rules_table = QTableWidget()
-        self.rules_table.setColumnCount(2)
-        self.rules_table.setHorizontalHeaderLabels([
+        self._model = RulesModel([
             tr('table_header_pattern'),
             tr('table_header_style_file'),
-        ])
+        ], self)
+        self.rules_table = QTableView()
+        self.rules_table.setModel(self._model)
+        self._font_metrics = QFontMetrics(self.rules_table.font())
         self.rules_table.setStyleSheet(TABLE_STYLE)
         self.rules_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.rules_table.setSelectionMode(QAbstractItemView.ExtendedSelection)
@@ -477,11 +694,19 @@ class EditDialog(QDialog):
         header.setSectionResizeMode(0, QHeaderView.Interactive)
         header.setSectionResizeMode(1, QHeaderView.Stretch)
 
-        # Set compact row height and show row numbers
-        self.rules_table.verticalHeader().setDefaultSectionSize(26)
-        self.rules_table.verticalHeader().setVisible(True)
-
-        # Set custom delegate for style file path column (with file browser button)
+        # Set compact, uniform row height and show row numbers. Fixed-height
+        # rows let the view lay out and paint only the visible rows, however
+        # many rules the config has.
+        vertical_header = self.rules_table.verticalHeader()
+        vertical_header.setDefaultSectionSize(26)
+        vertical_header.setSectionResizeMode(QHeaderView.Fixed)
+        vertical_header.setVisible(True)
+        self.rules_table.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+
+        # Lightweight delegate for all cells; the style file path column adds
+        # a file browser button
+        self.rule_item_delegate = RuleItemDelegate(self.rules_table)
+        self.rules_table.setItemDelegate(self.rule_item_delegate)
         self.style_file_delegate = StyleFileDelegate(self.rules_table)
         self.rules_table.setItemDelegateForColumn(1, self.style_file_delegate)
 
@@ -520,6 +745,26 @@ class EditDialog(QDialog):
         btn_layout.addStretch()
         layout.addLayout(btn_layout)
 
+    def _warn(self, title: str, text: str):
+        """
+        Show a warning message, reusing one message box per dialog.
+
+        :param title: Message box title
+        :param text: Message text
+        """
+        if self._warn_box is None:
+            self._warn_box = QMessageBox(QMessageBox.Warning, title, text, QMessageBox.Ok, self)
+        else:
+            self._warn_box.setWindowTitle(title)
+            self._warn_box.setText(text)
+        self._warn_box.exec_()
+
+    def changeEvent(self, event):
+        """Drop cached font metrics when the font changes."""
+        if event.type() == QEvent.FontChange:
+            self._font_metrics = None
+        super().changeEvent(event)
+
     def _load_config(self):
         """Load config data to form."""
         if self.config:
@@ -536,40 +781,27 @@ class EditDialog(QDialog):
 
         :param rules: Rules list
         """
-        self.rules_table.setRowCount(0)
-        for rule in rules:
-            row = self.rules_table.rowCount()
-            self.rules_table.insertRow(row)
-
-            pattern_item = QTableWidgetItem(rule.get('pattern', ''))
-            style_item = QTableWidgetItem(rule.get('style_file', ''))
-
-            self.rules_table.setItem(row, 0, pattern_item)
-            self.rules_table.setItem(row, 1, style_item)
-
-        # If no rules, add an empty row
-        if not rules:
-            self._add_empty_row()
+        self._model.load(rules)
 
     def _adjust_dialog_width(self):
         """Adjust dialog width and column width based on table content."""
-        font_metrics = QFontMetrics(self.rules_table.font())
-
-        # Calculate max width for each column (including header)
-        max_pattern_width = font_metrics.horizontalAdvance(tr('table_header_pattern')) + 24
-        max_style_width = font_metrics.horizontalAdvance(tr('table_header_style_file')) + 24
-
-        for row in range(self.rules_table.rowCount()):
-            pattern_item = self.rules_table.item(row, 0)
-            style_item = self.rules_table.item(row, 1)
-
-            if pattern_item and pattern_item.text():
-                width = font_metrics.horizontalAdvance(pattern_item.text()) + 24
-                max_pattern_width = max(max_pattern_width, width)
-
-            if style_item and style_item.text():
-                width = font_metrics.horizontalAdvance(style_item.text()) + 24
-                max_style_width = max(max_style_width, width)
+        if self._font_metrics is None:
+            self._font_metrics = QFontMetrics(self.rules_table.font())
+        font_metrics = self._font_metrics
+
+        # Calculate max width for each column (including header). Distinct
+        # texts are measured once; only a prefix of very long texts is measured
+        # since anything that long exceeds the maximum dialog width anyway.
+        rows = self._model.rows
+        measure = font_metrics.horizontalAdvance
+        patterns = {r[0][:MAX_DIALOG_WIDTH] for r in rows if r[0]}
+        styles = {r[1][:MAX_DIALOG_WIDTH] for r in rows if r[1]}
+        max_pattern_width = max(
+            [measure(t) for t in patterns] + [measure(tr('table_header_pattern'))]
+        ) + 24
+        max_style_width = max(
+            [measure(t) for t in styles] + [measure(tr('table_header_style_file'))]
+        ) + 24
 
         # Set first column width (fit content)
         self.rules_table.setColumnWidth(0, max_pattern_width)
@@ -587,120 +819,67 @@ class EditDialog(QDialog):
 
     def _add_empty_row(self):
         """Add an empty row."""
-        row = self.rules_table.rowCount()
-        self.rules_table.insertRow(row)
-        self.rules_table.setItem(row, 0, QTableWidgetItem(''))
-        self.rules_table.setItem(row, 1, QTableWidgetItem(''))
+        self._model.insert_row(self._model.rowCount())
 
     def _on_add_row(self):
         """Add row button clicked callback."""
         self._add_empty_row()
         # Select the newly added row
-        new_row = self.rules_table.rowCount() - 1
-        self.rules_table.selectRow(new_row)
-        self.rules_table.setCurrentCell(new_row, 0)
-        self.rules_table.editItem(self.rules_table.item(new_row, 0))
+        new_index = self._model.index(self._model.rowCount() - 1, 0)
+        self.rules_table.selectRow(new_index.row())
+        self.rules_table.setCurrentIndex(new_index)
+        self.rules_table.edit(new_index)
 
     def _on_remove_row(self):
         """Remove selected rows button clicked callback."""
-        selected_rows = set()
-        for item in self.rules_table.selectedItems():
-            selected_rows.add(item.row())
+        # One index per fully selected row (rows are selected as a whole)
+        selected_rows = {index.row() for index in self.rules_table.selectionModel().selectedRows()}
 
         if not selected_rows:
             return
 
-        # Delete from end to avoid index shifting
-        for row in sorted(selected_rows, reverse=True):
-            self.rules_table.removeRow(row)
+        self._model.remove_rows(selected_rows)
 
         # Ensure at least one row remains
-        if self.rules_table.rowCount() == 0:
+        if self._model.rowCount() == 0:
             self._add_empty_row()
 
     def _on_move_up(self):
         """Move selected row up."""
-        current_row = self.rules_table.currentRow()
+        current_row = self.rules_table.currentIndex().row()
         if current_row <= 0:
             return
 
-        self._swap_rows(current_row, current_row - 1)
+        self._model.move_row(current_row, current_row - 1)
         self.rules_table.selectRow(current_row - 1)
 
     def _on_move_down(self):
         """Move selected row down."""
-        current_row = self.rules_table.currentRow()
-        if current_row < 0 or current_row >= self.rules_table.rowCount() - 1:
+        current_row = self.rules_table.currentIndex().row()
+        if current_row < 0 or current_row >= self._model.rowCount() - 1:
             return
 
-        self._swap_rows(current_row, current_row + 1)
+        self._model.move_row(current_row, current_row + 1)
         self.rules_table.selectRow(current_row + 1)
 
     def _on_move_top(self):
         """Move selected row to top."""
-        current_row = self.rules_table.currentRow()
+        current_row = self.rules_table.currentIndex().row()
         if current_row <= 0:
             return
 
-        row_data = self._get_row_data(current_row)
-        self.rules_table.removeRow(current_row)
-        self.rules_table.insertRow(0)
-        self._set_row_data(0, row_data)
+        self._model.move_row(current_row, 0)
         self.rules_table.selectRow(0)
 
     def _on_move_bottom(self):
         """Move selected row to bottom."""
-        current_row = self.rules_table.currentRow()
-        last_row = self.rules_table.rowCount() - 1
+        current_row = self.rules_table.currentIndex().row()
+        last_row = self._model.rowCount() - 1
         if current_row < 0 or current_row >= last_row:
             return
 
-        row_data = self._get_row_data(current_row)
-        self.rules_table.removeRow(current_row)
-        new_last_row = self.rules_table.rowCount()
-        self.rules_table.insertRow(new_last_row)
-        self._set_row_data(new_last_row, row_data)
-        self.rules_table.selectRow(new_last_row)
-
-    def _get_row_data(self, row: int) -> List[str]:
-        """
-        Get data from specified row.
-
-        :param row: Row index
-        :return: Row data list
-        """
-        data = []
-        for col in range(self.rules_table.columnCount()):
-            item = self.rules_table.item(row, col)
-            data.append(item.text() if item else '')
-        return data
-
-    def _set_row_data(self, row: int, data: List[str]):
-        """
-        Set data for specified row.
-
-        :param row: Row index
-        :param data: Row data list
-        """
-        for col, text in enumerate(data):
-            self.rules_table.setItem(row, col, QTableWidgetItem(text))
-
-    def _swap_rows(self, row1: int, row2: int):
-        """
-        Swap two rows' data.
-
-        :param row1: First row index
-        :param row2: Second row index
-        """
-        for col in range(self.rules_table.columnCount()):
-            item1 = self.rules_table.item(row1, col)
-            item2 = self.rules_table.item(row2, col)
-
-            text1 = item1.text() if item1 else ''
-            text2 = item2.text() if item2 else ''
-
-            self.rules_table.setItem(row1, col, QTableWidgetItem(text2))
-            self.rules_table.setItem(row2, col, QTableWidgetItem(text1))
+        self._model.move_row(current_row, last_row)
+        self.rules_table.selectRow(last_row)
 
     def _on_toggle_mode(self):
         """Toggle edit mode."""
@@ -709,6 +888,8 @@ class EditDialog(QDialog):
             rules = self._get_rules_from_table()
             content = self._rules_to_content(rules)
             self.edit_content.setPlainText(content)
+            self._text_mode_src_rules = rules
+            self._text_mode_src_text = content
 
             self.edit_stack.setCurrentIndex(EDIT_MODE_TEXT)
             self.current_edit_mode = EDIT_MODE_TEXT
@@ -726,7 +907,10 @@ class EditDialog(QDialog):
         else:
             # Switch from text mode to table mode
             content = self.edit_content.toPlainText()
-            rules = self._parse_content_to_rules(content)
+            if content == self._text_mode_src_text:
+                rules = self._text_mode_src_rules
+            else:
+                rules = self._parse_content_to_rules(content)
 
             if rules is None:
                 # Parse failed, stay in text mode
@@ -755,32 +939,26 @@ class EditDialog(QDialog):
         :param content: Text content
         :return: Rules list, or None if parse failed
         """
-        import re
-
         rules = []
         if not content or not content.strip():
             return rules
 
-        # Match format: "pattern": "style_file"
-        pattern = re.compile(r'^"(.+)"\s*:\s*"(.+)"$')
-
-        for line_num, line in enumerate(content.strip().split('\n'), 1):
-            line = line.strip()
+        for line_num, raw_line in enumerate(content.splitlines(), 1):
+            line = raw_line.strip()
             if not line:
                 continue
 
-            match = pattern.match(line)
+            match = _LINE_RE.match(line)
             if not match:
-                QMessageBox.warning(
-                    self,
+                self._warn(
                     tr('format_error_title'),
                     tr('format_error_msg', line=line_num, content=line),
                 )
                 return None
 
             rules.append({
-                'pattern': match.group(1),
-                'style_file': match.group(2),
+                'pattern': match[1],
+                'style_file': match[2],
             })
 
         return rules
@@ -791,23 +969,7 @@ class EditDialog(QDialog):
 
         :return: Rules list
         """
-        rules = []
-        for row in range(self.rules_table.rowCount()):
-            pattern_item = self.rules_table.item(row, 0)
-            style_item = self.rules_table.item(row, 1)
-
-            pattern = pattern_item.text().strip() if pattern_item else ''
-            style_file = style_item.text().strip() if style_item else ''
-
-            # Skip empty rows
-            if not pattern and not style_file:
-                continue
-
-            rules.append({
-                'pattern': pattern,
-                'style_file': style_file,
-            })
-        return rules
+        return list(self._model.iter_rules())
 
     def _rules_to_content(self, rules: List[Dict]) -> str:
         """
@@ -816,17 +978,13 @@ class EditDialog(QDialog):
         :param rules: Rules list
         :return: Text format content
         """
-        lines = []
-        for rule in rules:
-            pattern = rule.get('pattern', '')
-            style_file = rule.get('style_file', '')
-            lines.append(f'"{pattern}": "{style_file}"')
-        return '\n'.join(lines)
+        return '\n'.join(
+            f'"{rule.get("pattern", "")}": "{rule.get("style_file", "")}"'
+            for rule in rules
+        )
 
     def _on_save_clicked(self):
         """Save button clicked callback."""
-        import re
-
         name = self.edit_name.text().strip()
 
         # Get rules based on current mode
@@ -839,7 +997,7 @@ class EditDialog(QDialog):
                 return
 
         if not name:
-            QMessageBox.warning(self, tr('error_title'), tr('name_required_error'))
+            self._warn(tr('error_title'), tr('name_required_error'))
             self.edit_name.setFocus()
             return
 
@@ -847,40 +1005,86 @@ class EditDialog(QDialog):
         if not self.is_edit_mode or name != self.old_name:
             existing_configs = self.style_manager.list_configs()
             if name in existing_configs:
-                QMessageBox.warning(self, tr('error_title'), tr('name_exists_error', name=name))
+                self._warn(tr('error_title'), tr('name_exists_error', name=name))
                 self.edit_name.setFocus()
                 return
 
-        # Validate rules
+        # First row missing its pattern or style file
+        required_row, required_key = len(rules), None
         for i, rule in enumerate(rules):
             pattern = rule.get('pattern', '')
             style_file = rule.get('style_file', '')
-
             if pattern and not style_file:
-                QMessageBox.warning(self, tr('error_title'), tr('style_file_required_error', row=i + 1))
-                if self.current_edit_mode == EDIT_MODE_TABLE:
-                    self.rules_table.selectRow(i)
-                return
-
+                required_row, required_key = i, 'style_file_required_error'
+                break
             if style_file and not pattern:
-                QMessageBox.warning(self, tr('error_title'), tr('pattern_required_error', row=i + 1))
-                if self.current_edit_mode == EDIT_MODE_TABLE:
-                    self.rules_table.selectRow(i)
-                return
+                required_row, required_key = i, 'pattern_required_error'
+                break
 
-            # Validate regex syntax
-            if pattern:
-                try:
-                    re.compile(pattern)
-                except re.error as e:
-                    QMessageBox.warning(
-                        self,
-                        tr('error_title'),
-                        tr('regex_syntax_error', row=i + 1, error=str(e)),
-                    )
-                    if self.current_edit_mode == EDIT_MODE_TABLE:
-                        self.rules_table.selectRow(i)
-                    return
+        # Validate regex syntax of the rows before it (compiled patterns are
+        # shared with saving and style application). Large rule sets are
+        # checked on a worker thread so the dialog stays responsive.
+        patterns = [rule.get('pattern', '') for rule in rules[:required_row]]
+        self._pending_save = (name, rules, required_row, required_key)
+
+        if len(patterns) < ASYNC_VALIDATION_MIN_RULES:
+            self._on_patterns_validated(*_first_invalid_pattern(patterns))
+            return
+
+        # Block input and cancelling (see reject) until the result arrives
+        self.setEnabled(False)
+        self.setCursor(Qt.BusyCursor)
+        QThreadPool.globalInstance().start(
+            _PatternValidationTask(patterns, self._validation_signals)
+        )
+
+    def reject(self):
+        """Ignore cancel requests while a save is waiting for validation."""
+        if self._pending_save is not None:
+            return
+        super().reject()
+
+    def _on_async_patterns_validated(self, row: int, error: str):
+        """
+        Handle the result of worker-thread validation.
+
+        :param row: Index of the first invalid pattern, -1 if all are valid
+        :param error: Regex error message
+        """
+        self.setEnabled(True)
+        self.unsetCursor()
+
+        # Drop results that arrive after the dialog was closed
+        if self._pending_save is None or not self.isVisible():
+            self._pending_save = None
+            return
+
+        self._on_patterns_validated(row, error)
+
+    def _on_patterns_validated(self, row: int, error: str):
+        """
+        Finish saving once regex validation is done.
+
+        :param row: Index of the first invalid pattern, -1 if all are valid
+        :param error: Regex error message
+        """
+        name, rules, required_row, required_key = self._pending_save
+        self._pending_save = None
+
+        if row >= 0:
+            self._warn(
+                tr('error_title'),
+                tr('regex_syntax_error', row=row + 1, error=error),
+            )
+            if self.current_edit_mode == EDIT_MODE_TABLE:
+                self.rules_table.selectRow(row)
+            return
+
+        if required_key:
+            self._warn(tr('error_title'), tr(required_key, row=required_row + 1))
+            if self.current_edit_mode == EDIT_MODE_TABLE:
+                self.rules_table.selectRow(required_row)
+            return
 
         # Convert to text format for compatibility with existing save logic
         content = self._rules_to_content(rules)
@@ -892,7 +1096,7 @@ class EditDialog(QDialog):
         if success:
             self.accept()
         else:
-            QMessageBox.warning(self, tr('save_failed_title'), error)
+            self._warn(tr('save_failed_title'), error)
 
     def get_name(self) -> str:
         """
@@ -5,10 +5,13 @@ AutoStyle Main Dialog
 Provides style config selection, add, edit, delete and apply functionality.
 """
 
+import heapq
 import os
+import tempfile
+from typing import List, Optional
 
-from qgis.PyQt.QtCore import QSize, Qt
-from qgis.PyQt.QtGui import QIcon, QPixmap
+from qgis.PyQt.QtCore import QByteArray, QEvent, QSize, Qt, pyqtSlot
+from qgis.PyQt.QtGui import QFontMetrics, QIcon, QPainter, QPixmap
 from qgis.PyQt.QtSvg import QSvgRenderer
 from qgis.PyQt.QtWidgets import (
     QComboBox,
@@ -18,8 +21,10 @@ from qgis.PyQt.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QMessageBox,
+    QProgressDialog,
     QPushButton,
     QSizePolicy,
+    QTextBrowser,
     QTextEdit,
     QToolButton,
     QVBoxLayout,
@@ -27,7 +32,9 @@ from qgis.PyQt.QtWidgets import (
 
 from ..core.i18n import tr
 from ..core.layer_processor import LayerProcessor
+from ..core.paths import get_styles_dir
 from ..core.style_manager import StyleManager
+from .edit_dialog import EditDialog
 
 # Button size constants
 BUTTON_MIN_WIDTH = 70
@@ -38,22 +45,34 @@ DIALOG_MIN_WIDTH = 400
 DIALOG_MAX_WIDTH = 800
 DIALOG_HEIGHT = 110
 
+# Number of longest config names measured when sizing the dialog
+WIDTH_CANDIDATE_COUNT = 5
+
+# Widget styles, scoped by object name and applied once through the dialog
+# stylesheet (see get_dialog_style)
+OBJECT_NAME_NORMAL_BUTTON = "autostyleNormalButton"
+OBJECT_NAME_PRIMARY_BUTTON = "autostylePrimaryButton"
+OBJECT_NAME_ICON_BUTTON = "autostyleIconButton"
+OBJECT_NAME_HELP_BUTTON = "autostyleHelpButton"
+OBJECT_NAME_CONFIG_COMBO = "autostyleConfigCombo"
+OBJECT_NAME_HELP_BROWSER = "autostyleHelpBrowser"
+
 # Button styles
 BUTTON_STYLE_NORMAL = """
-    QPushButton {
+    QPushButton#autostyleNormalButton {
         background-color: #F0F0F0;
         border: 1px solid #C0C0C0;
         border-radius: 4px;
         padding: 4px 12px;
     }
-    QPushButton:hover {
+    QPushButton#autostyleNormalButton:hover {
         background-color: #E5E5E5;
         border: 1px solid #A0A0A0;
     }
-    QPushButton:pressed {
+    QPushButton#autostyleNormalButton:pressed {
         background-color: #D0D0D0;
     }
-    QPushButton:disabled {
+    QPushButton#autostyleNormalButton:disabled {
         background-color: #F5F5F5;
         border: 1px solid #D0D0D0;
         color: #A0A0A0;
@@ -61,7 +80,7 @@ BUTTON_STYLE_NORMAL = """
 """
 
 BUTTON_STYLE_PRIMARY = """
-    QPushButton {
+    QPushButton#autostylePrimaryButton {
         background-color: #4DA6FF;
         border: 1px solid #3399FF;
         border-radius: 4px;
@@ -69,14 +88,14 @@ BUTTON_STYLE_PRIMARY = """
         color: white;
         font-weight: bold;
     }
-    QPushButton:hover {
+    QPushButton#autostylePrimaryButton:hover {
         background-color: #3399FF;
         border: 1px solid #1A8CFF;
     }
-    QPushButton:pressed {
+    QPushButton#autostylePrimaryButton:pressed {
         background-color: #1A8CFF;
     }
-    QPushButton:disabled {
+    QPushButton#autostylePrimaryButton:disabled {
         background-color: #B3D9FF;
         border: 1px solid #99CCFF;
         color: #E0E0E0;
@@ -99,70 +118,111 @@ def get_combobox_style(arrow_icon_path: str) -> str:
     # Convert backslashes to forward slashes (Windows compatibility)
     arrow_icon_path = arrow_icon_path.replace('\\', '/')
     return f"""
-    QComboBox {{
+    QComboBox#autostyleConfigCombo {{
         background-color: #FFFFFF;
         border: 1px solid #D0D0D0;
         border-radius: 4px;
         padding: 4px 8px;
         padding-right: 24px;
     }}
-    QComboBox:hover {{
+    QComboBox#autostyleConfigCombo:hover {{
         border: 1px solid #A0A0A0;
     }}
-    QComboBox:focus {{
+    QComboBox#autostyleConfigCombo:focus {{
         border: 1px solid #4DA6FF;
     }}
-    QComboBox::drop-down {{
+    QComboBox#autostyleConfigCombo::drop-down {{
         subcontrol-origin: padding;
         subcontrol-position: center right;
         width: 24px;
         border: none;
         background: transparent;
     }}
-    QComboBox::down-arrow {{
+    QComboBox#autostyleConfigCombo::down-arrow {{
         image: url({arrow_icon_path});
         width: 12px;
         height: 12px;
     }}
-    QComboBox QAbstractItemView {{
+    QComboBox#autostyleConfigCombo QAbstractItemView {{
         background-color: #FFFFFF;
         border: 1px solid #D0D0D0;
         selection-background-color: #E8F4FF;
         selection-color: #333333;
         outline: none;
     }}
-    QComboBox QAbstractItemView::item {{
+    QComboBox#autostyleConfigCombo QAbstractItemView::item {{
         padding: 6px 8px;
         min-height: 24px;
     }}
-    QComboBox QAbstractItemView::item:hover {{
+    QComboBox#autostyleConfigCombo QAbstractItemView::item:hover {{
         background-color: #F0F0F0;
     }}
-    QComboBox QAbstractItemView::item:selected {{
+    QComboBox#autostyleConfigCombo QAbstractItemView::item:selected {{
         background-color: #E8F4FF;
     }}
     """
 
 # Icon button style
 ICON_BUTTON_SIZE = 24
+ICON_SIZE = QSize(16, 16)
+ICON_BUTTON_FIXED_SIZE = QSize(BUTTON_HEIGHT, BUTTON_HEIGHT)
 ICON_BUTTON_STYLE = """
-    QToolButton {
+    QToolButton#autostyleIconButton {
         background-color: transparent;
         border: 1px solid transparent;
         border-radius: 4px;
     }
-    QToolButton:hover {
+    QToolButton#autostyleIconButton:hover {
         background-color: #E5E5E5;
         border: 1px solid #C0C0C0;
     }
-    QToolButton:pressed {
+    QToolButton#autostyleIconButton:pressed {
         background-color: #D0D0D0;
     }
-    QToolButton:disabled {
+    QToolButton#autostyleIconButton:disabled {
         opacity: 0.5;
     }
 """
 
+# Help icon button style (no frame, looks like a plain icon)
+HELP_BUTTON_STYLE = """
+    QToolButton#autostyleHelpButton {
+        background-color: transparent;
+        border: none;
+        padding: 0px;
+    }
+"""
+
+# Help text browser style
+HELP_BROWSER_STYLE = """
+    QTextBrowser#autostyleHelpBrowser {
+        background-color: #FFFFFF;
+        border: 1px solid #D0D0D0;
+        border-radius: 4px;
+        padding: 8px;
+    }
+"""
+
+
+def get_dialog_style(arrow_icon_path: str) -> str:
+    """
+    Get the stylesheet for the main dialog and its child dialogs.
+
+    Setting one stylesheet on the dialog means it is parsed once, instead of
+    once per widget.
+
+    :param arrow_icon_path: Combobox arrow icon file path
+    :return: Style string
+    """
+    return (
+        BUTTON_STYLE_NORMAL
+        + BUTTON_STYLE_PRIMARY
+        + ICON_BUTTON_STYLE
+        + HELP_BUTTON_STYLE
+        + get_combobox_style(arrow_icon_path)
+        + HELP_BROWSER_STYLE
+    )
+
 # SVG icon definitions (unified style: 2px stroke width, rounded, dark gray #505050)
 SVG_ICON_ADD = '''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="#505050" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
   <line x1="12" y1="5" x2="12" y2="19"/>
@@ -198,6 +258,40 @@ SVG_ICON_IMPORT = '''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24"
   <line x1="12" y1="3" x2="12" y2="15"/>
 </svg>'''
 
+# Icons used by the main dialog, rendered together by prebuild_icons
+DIALOG_ICONS = (
+    SVG_ICON_ADD,
+    SVG_ICON_EDIT,
+    SVG_ICON_DELETE,
+    SVG_ICON_EXPORT,
+    SVG_ICON_IMPORT,
+    SVG_ICON_HELP,
+)
+
+# Rendered pixmaps and icons keyed by (svg_content, size), shared by every dialog instance
+_PIXMAP_CACHE = {}
+_ICON_CACHE = {}
+
+
+def create_svg_pixmap(svg_content: str, size: int = 16) -> QPixmap:
+    """
+    Create QPixmap from SVG string.
+
+    Pixmaps are rendered once per process and then served from a cache;
+    QPixmap is implicitly shared, so handing the same instance to several
+    widgets is safe.
+
+    :param svg_content: SVG content string
+    :param size: Pixmap size
+    :return: QPixmap object
+    """
+    key = (svg_content, size)
+    pixmap = _PIXMAP_CACHE.get(key)
+    if pixmap is None:
+        pixmap = _render_svg_pixmap(svg_content, size)
+        _PIXMAP_CACHE[key] = pixmap
+    return pixmap
+
 
 def create_svg_icon(svg_content: str, size: int = 16) -> QIcon:
     """
@@ -205,18 +299,71 @@ def create_svg_icon(svg_content: str, size: int = 16) -> QIcon:
 
     :param svg_content: SVG content string
     :param size: Icon size
-    :return: QIcon object
+    :return: QIcon object (cached, see create_svg_pixmap)
+    """
+    key = (svg_content, size)
+    icon = _ICON_CACHE.get(key)
+    if icon is None:
+        icon = QIcon(create_svg_pixmap(svg_content, size))
+        _ICON_CACHE[key] = icon
+    return icon
+
+
+def prebuild_icons(size: int = 16):
+    """
+    Render all dialog icons that are not cached yet.
+
+    One QSvgRenderer is reused for the whole batch, so the first dialog
+    shown pays a single renderer setup and later lookups are cache hits.
+
+    :param size: Icon size
     """
-    from qgis.PyQt.QtCore import QByteArray
-    from qgis.PyQt.QtGui import QPainter
+    renderer = None
+    for svg_content in DIALOG_ICONS:
+        key = (svg_content, size)
+        if key in _PIXMAP_CACHE:
+            continue
+        if renderer is None:
+            renderer = QSvgRenderer()
+        _PIXMAP_CACHE[key] = _render_svg_pixmap(svg_content, size, renderer)
+
 
-    renderer = QSvgRenderer(QByteArray(svg_content.encode('utf-8')))
+def _render_svg_pixmap(svg_content: str, size: int, renderer: Optional[QSvgRenderer] = None) -> QPixmap:
+    """
+    Render an SVG string into a transparent QPixmap.
+
+    :param svg_content: SVG content string
+    :param size: Pixmap size
+    :param renderer: Renderer to reuse (loaded with the SVG), or None for a new one
+    :return: QPixmap object
+    """
+    data = QByteArray(svg_content.encode('utf-8'))
+    if renderer is None:
+        renderer = QSvgRenderer(data)
+    else:
+        renderer.load(data)
     pixmap = QPixmap(size, size)
     pixmap.fill(Qt.transparent)
     painter = QPainter(pixmap)
     renderer.render(painter)
     painter.end()
-    return QIcon(pixmap)
+    return pixmap
+
+
+def get_dropdown_icon_path() -> str:
+    """
+    Get the dropdown arrow icon file, writing it only if it is missing.
+
+    Qt stylesheets can only load images from files or resources, so the
+    icon has to exist on disk; it is written once and reused afterwards.
+
+    :return: Icon file path
+    """
+    icon_path = os.path.join(tempfile.gettempdir(), 'autostyle_dropdown.svg')
+    if not os.path.exists(icon_path):
+        with open(icon_path, 'w', encoding='utf-8') as f:
+            f.write(SVG_ICON_DROPDOWN)
+    return icon_path
 
 
 class MainDialog(QDialog):
@@ -234,39 +381,68 @@ class MainDialog(QDialog):
         self.plugin_dir = plugin_dir
         self.iface = iface
 
-        # Use user's QGIS config directory for storing styles
-        from ..core.paths import get_styles_dir
-        self.styles_dir = get_styles_dir()
-        self.style_manager = StyleManager(self.styles_dir)
-        self.layer_processor = LayerProcessor(iface)
-
-        # Create dropdown arrow icon file
-        self._dropdown_icon_path = self._create_dropdown_icon()
-
         self.setWindowTitle("AutoStyle")
         self.setMinimumWidth(DIALOG_MIN_WIDTH)
         self.setMaximumWidth(DIALOG_MAX_WIDTH)
         self.setFixedHeight(DIALOG_HEIGHT)
         self.setWindowFlags(self.windowFlags() & ~Qt.WindowContextHelpButtonHint)
 
-        self._setup_ui()
-        self._load_configs()
-        self._adjust_width()
+        # Widgets and managers are built on first show
+        self._ui_built = False
+        self._font_metrics = None
+
+        # Config name -> combobox index, kept in sync by _load_configs
+        self._config_index = {}
+        # Last state applied by _update_button_states
+        self._last_has_config = None
 
-    def _create_dropdown_icon(self) -> str:
+        # Help and result dialogs, built on first use
+        self._help_dialog = None
+        self._help_browser = None
+        self._help_content = None
+        self._result_dialog = None
+        self._result_text = None
+
+    def showEvent(self, event):
         """
-        Create dropdown arrow icon file.
+        Build the UI the first time the dialog is shown.
 
-        :return: Icon file path
+        :param event: Show event
         """
-        import tempfile
-        icon_path = os.path.join(tempfile.gettempdir(), 'autostyle_dropdown.svg')
-        with open(icon_path, 'w', encoding='utf-8') as f:
-            f.write(SVG_ICON_DROPDOWN)
-        return icon_path
+        self._ensure_ui_built()
+        super().showEvent(event)
+
+    def changeEvent(self, event):
+        """Drop cached font metrics when the font changes."""
+        if event.type() == QEvent.FontChange:
+            self._font_metrics = None
+        super().changeEvent(event)
+
+    def _ensure_ui_built(self):
+        """Create managers, widgets and the config list if not done yet."""
+        if self._ui_built:
+            return
+        self._ui_built = True
+
+        # Use user's QGIS config directory for storing styles
+        self.styles_dir = get_styles_dir()
+        self.style_manager = StyleManager(self.styles_dir)
+        self.layer_processor = LayerProcessor(self.iface)
+
+        # Dropdown arrow icon file for the combobox stylesheet
+        self._dropdown_icon_path = get_dropdown_icon_path()
+
+        # Render every button icon in one batch before the widgets ask for them
+        prebuild_icons()
+
+        self._setup_ui()
+        self._load_configs()
 
     def _setup_ui(self):
         """Setup UI layout."""
+        # One stylesheet for all widgets, set before any child is created
+        self.setStyleSheet(get_dialog_style(self._dropdown_icon_path))
+
         # Main layout uses vertical layout
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(12, 12, 12, 12)
@@ -291,7 +467,7 @@ class MainDialog(QDialog):
         self.combo_configs = QComboBox()
         self.combo_configs.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.combo_configs.setFixedHeight(BUTTON_HEIGHT)
-        self.combo_configs.setStyleSheet(get_combobox_style(self._dropdown_icon_path))
+        self.combo_configs.setObjectName(OBJECT_NAME_CONFIG_COMBO)
         self.combo_configs.currentIndexChanged.connect(self._on_config_changed)
         select_layout.addWidget(self.combo_configs)
 
@@ -301,55 +477,24 @@ class MainDialog(QDialog):
         icon_btn_layout.setContentsMargins(0, 0, 0, 0)
         icon_btn_layout.setAlignment(Qt.AlignVCenter)
 
-        # Add button (+)
-        self.btn_add = QToolButton()
-        self.btn_add.setIcon(create_svg_icon(SVG_ICON_ADD, 16))
-        self.btn_add.setIconSize(QSize(16, 16))
-        self.btn_add.setFixedSize(QSize(BUTTON_HEIGHT, BUTTON_HEIGHT))
-        self.btn_add.setStyleSheet(ICON_BUTTON_STYLE)
-        self.btn_add.setToolTip(tr('add_config_tooltip'))
-        self.btn_add.clicked.connect(self._on_add_clicked)
-        icon_btn_layout.addWidget(self.btn_add)
-
-        # Edit button (pencil)
-        self.btn_edit = QToolButton()
-        self.btn_edit.setIcon(create_svg_icon(SVG_ICON_EDIT, 16))
-        self.btn_edit.setIconSize(QSize(16, 16))
-        self.btn_edit.setFixedSize(QSize(BUTTON_HEIGHT, BUTTON_HEIGHT))
-        self.btn_edit.setStyleSheet(ICON_BUTTON_STYLE)
-        self.btn_edit.setToolTip(tr('edit_config_tooltip'))
-        self.btn_edit.clicked.connect(self._on_edit_clicked)
-        icon_btn_layout.addWidget(self.btn_edit)
-
-        # Delete button (trash)
-        self.btn_delete = QToolButton()
-        self.btn_delete.setIcon(create_svg_icon(SVG_ICON_DELETE, 16))
-        self.btn_delete.setIconSize(QSize(16, 16))
-        self.btn_delete.setFixedSize(QSize(BUTTON_HEIGHT, BUTTON_HEIGHT))
-        self.btn_delete.setStyleSheet(ICON_BUTTON_STYLE)
-        self.btn_delete.setToolTip(tr('delete_config_tooltip'))
-        self.btn_delete.clicked.connect(self._on_delete_clicked)
-        icon_btn_layout.addWidget(self.btn_delete)
-
-        # Export button
-        self.btn_export = QToolButton()
-        self.btn_export.setIcon(create_svg_icon(SVG_ICON_EXPORT, 16))
-        self.btn_export.setIconSize(QSize(16, 16))
-        self.btn_export.setFixedSize(QSize(BUTTON_HEIGHT, BUTTON_HEIGHT))
-        self.btn_export.setStyleSheet(ICON_BUTTON_STYLE)
-        self.btn_export.setToolTip(tr('export_config_tooltip'))
-        self.btn_export.clicked.connect(self._on_export_clicked)
-        icon_btn_layout.addWidget(self.btn_export)
-
-        # Import button
-        self.btn_import = QToolButton()
-        self.btn_import.setIcon(create_svg_icon(SVG_ICON_IMPORT, 16))
-        self.btn_import.setIconSize(QSize(16, 16))
-        self.btn_import.setFixedSize(QSize(BUTTON_HEIGHT, BUTTON_HEIGHT))
-        self.btn_import.setStyleSheet(ICON_BUTTON_STYLE)
-        self.btn_import.setToolTip(tr('import_config_tooltip'))
-        self.btn_import.clicked.connect(self._on_import_clicked)
-        icon_btn_layout.addWidget(self.btn_import)
+        # Icon buttons: (attribute name, icon, tooltip key, click handler)
+        icon_buttons = (
+            ('btn_add', SVG_ICON_ADD, 'add_config_tooltip', self._on_add_clicked),
+            ('btn_edit', SVG_ICON_EDIT, 'edit_config_tooltip', self._on_edit_clicked),
+            ('btn_delete', SVG_ICON_DELETE, 'delete_config_tooltip', self._on_delete_clicked),
+            ('btn_export', SVG_ICON_EXPORT, 'export_config_tooltip', self._on_export_clicked),
+            ('btn_import', SVG_ICON_IMPORT, 'import_config_tooltip', self._on_import_clicked),
+        )
+        for attr, svg_content, tooltip_key, handler in icon_buttons:
+            button = QToolButton()
+            button.setIcon(create_svg_icon(svg_content, 16))
+            button.setIconSize(ICON_SIZE)
+            button.setFixedSize(ICON_BUTTON_FIXED_SIZE)
+            button.setObjectName(OBJECT_NAME_ICON_BUTTON)
+            button.setToolTip(tr(tooltip_key))
+            button.clicked.connect(handler)
+            icon_btn_layout.addWidget(button)
+            setattr(self, attr, button)
 
         select_layout.addLayout(icon_btn_layout)
 
@@ -360,14 +505,16 @@ class MainDialog(QDialog):
         btn_layout.setSpacing(8)
         btn_layout.setAlignment(Qt.AlignVCenter)
 
-        # Help icon
-        self.lbl_help_icon = QLabel()
-        self.lbl_help_icon.setPixmap(create_svg_icon(SVG_ICON_HELP, 16).pixmap(16, 16))
-        self.lbl_help_icon.setFixedSize(16, BUTTON_HEIGHT)
-        self.lbl_help_icon.setAlignment(Qt.AlignCenter)
-        self.lbl_help_icon.setCursor(Qt.PointingHandCursor)
-        self.lbl_help_icon.mousePressEvent = lambda e: self._on_help_clicked()
-        btn_layout.addWidget(self.lbl_help_icon)
+        # Help icon (flat button, drawn like a plain icon)
+        self.btn_help = QToolButton()
+        self.btn_help.setIcon(create_svg_icon(SVG_ICON_HELP, 16))
+        self.btn_help.setIconSize(ICON_SIZE)
+        self.btn_help.setFixedSize(16, BUTTON_HEIGHT)
+        self.btn_help.setAutoRaise(True)
+        self.btn_help.setObjectName(OBJECT_NAME_HELP_BUTTON)
+        self.btn_help.setCursor(Qt.PointingHandCursor)
+        self.btn_help.clicked.connect(self._on_help_clicked)
+        btn_layout.addWidget(self.btn_help)
 
         # Help text
         help_text = tr('help_link')
@@ -384,14 +531,14 @@ class MainDialog(QDialog):
         self.btn_apply = QPushButton(tr('apply_button'))
         self.btn_apply.setFixedHeight(BUTTON_HEIGHT)
         self.btn_apply.setMinimumWidth(80)
-        self.btn_apply.setStyleSheet(BUTTON_STYLE_PRIMARY)
+        self.btn_apply.setObjectName(OBJECT_NAME_PRIMARY_BUTTON)
         self.btn_apply.clicked.connect(self._on_apply_clicked)
         btn_layout.addWidget(self.btn_apply)
 
         self.btn_close = QPushButton(tr('close_button'))
         self.btn_close.setFixedHeight(BUTTON_HEIGHT)
         self.btn_close.setMinimumWidth(BUTTON_MIN_WIDTH)
-        self.btn_close.setStyleSheet(BUTTON_STYLE_NORMAL)
+        self.btn_close.setObjectName(OBJECT_NAME_NORMAL_BUTTON)
         self.btn_close.clicked.connect(self.close)
         btn_layout.addWidget(self.btn_close)
 
@@ -399,38 +546,89 @@ class MainDialog(QDialog):
 
         main_layout.addWidget(config_group)
 
+        # Static texts used by the action handlers, translated once
+        self._t = {
+            key: tr(key)
+            for key in (
+                'apply_result_complete',
+                'apply_result_details',
+                'apply_result_title',
+                'error_title',
+                'hint_title',
+                'no_rules_hint',
+                'help_title',
+            )
+        }
+
     def _load_configs(self):
         """Load config list."""
-        current_text = self.combo_configs.currentText()
-        self.combo_configs.clear()
+        if not self._ui_built:
+            # The list is loaded when the UI is built
+            return
 
+        combo = self.combo_configs
         configs = self.style_manager.list_configs()
-        self.combo_configs.addItems(configs)
+        items = [combo.itemText(i) for i in range(combo.count())]
 
-        # Restore previously selected config
-        if current_text:
-            index = self.combo_configs.findText(current_text)
-            if index >= 0:
-                self.combo_configs.setCurrentIndex(index)
+        if items != configs:
+            current_text = combo.currentText()
+            self._config_index = {name: i for i, name in enumerate(configs)}
+
+            # Update the items in place; signals are blocked so the selection
+            # handler does not run for every intermediate change
+            combo.blockSignals(True)
+            try:
+                self._sync_combo_items(items, configs)
+
+                # Restore previously selected config, else select the first one
+                index = self._config_index.get(current_text, -1)
+                if index < 0 and configs:
+                    index = 0
+                combo.setCurrentIndex(index)
+            finally:
+                combo.blockSignals(False)
+
+            self._adjust_width()
 
         self._update_button_states()
-        self._adjust_width()
+
+    def _sync_combo_items(self, items: List[str], configs: List[str]):
+        """
+        Make the config combobox items match a new config list.
+
+        Only the names that were removed or added are touched; both lists are
+        sorted, so the remaining items keep their relative order.
+
+        :param items: Current combobox item texts
+        :param configs: New sorted config names
+        """
+        combo = self.combo_configs
+        wanted = set(configs)
+        for i in range(len(items) - 1, -1, -1):
+            if items[i] not in wanted:
+                combo.removeItem(i)
+
+        for i, name in enumerate(configs):
+            if i >= combo.count() or combo.itemText(i) != name:
+                combo.insertItem(i, name)
 
     def _adjust_width(self):
         """Adjust dialog width based on config names."""
-        from qgis.PyQt.QtGui import QFontMetrics
-
         if self.combo_configs.count() == 0:
             self.resize(DIALOG_MIN_WIDTH, DIALOG_HEIGHT)
             return
 
-        # Calculate max text width
-        font_metrics = QFontMetrics(self.combo_configs.font())
-        max_text_width = 0
-        for i in range(self.combo_configs.count()):
-            text = self.combo_configs.itemText(i)
-            text_width = font_metrics.horizontalAdvance(text)
-            max_text_width = max(max_text_width, text_width)
+        if self._font_metrics is None:
+            self._font_metrics = QFontMetrics(self.combo_configs.font())
+
+        # Calculate max text width. Only the longest names (by character count)
+        # are measured; a few candidates cover names mixing narrow and wide
+        # (e.g. CJK) characters.
+        texts = (self.combo_configs.itemText(i) for i in range(self.combo_configs.count()))
+        measure = self._font_metrics.horizontalAdvance
+        max_text_width = max(
+            measure(text) for text in heapq.nlargest(WIDTH_CANDIDATE_COUNT, texts, key=len)
+        )
 
         # Add padding for combobox (dropdown arrow, padding, border)
         combobox_extra = 60
@@ -446,42 +644,60 @@ class MainDialog(QDialog):
 
         self.resize(total_width, DIALOG_HEIGHT)
 
+    def _msg(self, kind: str, title: str, text: str):
+        """
+        Show a message box.
+
+        :param kind: 'information', 'warning' or 'question' (Yes/No, default No)
+        :param title: Message box title
+        :param text: Message text
+        :return: The clicked standard button
+        """
+        if kind == 'question':
+            return QMessageBox.question(
+                self, title, text, QMessageBox.Yes | QMessageBox.No, QMessageBox.No
+            )
+        return getattr(QMessageBox, kind)(self, title, text)
+
     def _update_button_states(self):
         """Update button states."""
         has_config = self.combo_configs.count() > 0
+        if has_config == self._last_has_config:
+            return
+        self._last_has_config = has_config
+
         self.btn_edit.setEnabled(has_config)
         self.btn_delete.setEnabled(has_config)
         self.btn_export.setEnabled(has_config)
         self.btn_apply.setEnabled(has_config)
 
+    @pyqtSlot(int)
     def _on_config_changed(self, index):
         """Config selection changed callback."""
         self._update_button_states()
 
+    @pyqtSlot()
     def _on_add_clicked(self):
         """Add button clicked callback."""
-        from .edit_dialog import EditDialog
-
         dialog = EditDialog(self.style_manager, parent=self)
         if dialog.exec_():
             self._load_configs()
             # Select the newly added config
             new_name = dialog.get_name()
-            index = self.combo_configs.findText(new_name)
+            index = self._config_index.get(new_name, -1)
             if index >= 0:
                 self.combo_configs.setCurrentIndex(index)
 
+    @pyqtSlot()
     def _on_edit_clicked(self):
         """Edit button clicked callback."""
-        from .edit_dialog import EditDialog
-
         current_name = self.combo_configs.currentText()
         if not current_name:
             return
 
         config = self.style_manager.load_config(current_name)
         if not config:
-            QMessageBox.warning(self, tr('error_title'), tr('load_config_error', name=current_name))
+            self._msg('warning', self._t['error_title'], tr('load_config_error', name=current_name))
             return
 
         dialog = EditDialog(self.style_manager, config=config, parent=self)
@@ -489,22 +705,21 @@ class MainDialog(QDialog):
             self._load_configs()
             # Select the edited config
             new_name = dialog.get_name()
-            index = self.combo_configs.findText(new_name)
+            index = self._config_index.get(new_name, -1)
             if index >= 0:
                 self.combo_configs.setCurrentIndex(index)
 
+    @pyqtSlot()
     def _on_delete_clicked(self):
         """Delete button clicked callback."""
         current_name = self.combo_configs.currentText()
         if not current_name:
             return
 
-        reply = QMessageBox.question(
-            self,
+        reply = self._msg(
+            'question',
             tr('confirm_delete_title'),
             tr('confirm_delete_msg', name=current_name),
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No,
         )
 
         if reply == QMessageBox.Yes:
@@ -512,13 +727,14 @@ class MainDialog(QDialog):
             if success:
                 self._load_configs()
             else:
-                QMessageBox.warning(self, tr('delete_failed_title'), error)
+                self._msg('warning', tr('delete_failed_title'), error)
 
+    @pyqtSlot()
     def _on_export_clicked(self):
         """Export button clicked callback."""
         current_name = self.combo_configs.currentText()
         if not current_name:
-            QMessageBox.warning(self, tr('hint_title'), tr('no_config_selected'))
+            self._msg('warning', self._t['hint_title'], tr('no_config_selected'))
             return
 
         # Open file save dialog
@@ -528,7 +744,6 @@ class MainDialog(QDialog):
             tr('export_config_title'),
             default_filename,
             tr('json_file_filter'),
-            options=QFileDialog.DontUseNativeDialog,
         )
 
         if not file_path:
@@ -537,18 +752,11 @@ class MainDialog(QDialog):
         # Export config
         success, error = self.style_manager.export_config(current_name, file_path)
         if success:
-            QMessageBox.information(
-                self,
-                tr('export_config_title'),
-                tr('export_success', path=file_path),
-            )
+            self._msg('information', tr('export_config_title'), tr('export_success', path=file_path))
         else:
-            QMessageBox.warning(
-                self,
-                tr('error_title'),
-                tr('export_failed', error=error),
-            )
+            self._msg('warning', self._t['error_title'], tr('export_failed', error=error))
 
+    @pyqtSlot()
     def _on_import_clicked(self):
         """Import button clicked callback."""
         # Open file dialog
@@ -557,7 +765,6 @@ class MainDialog(QDialog):
             tr('import_config_title'),
             "",
             tr('json_file_filter'),
-            options=QFileDialog.DontUseNativeDialog,
         )
 
         if not file_path:
@@ -569,12 +776,10 @@ class MainDialog(QDialog):
         if not success:
             if error == "EXISTS":
                 # Config already exists, ask for confirmation
-                reply = QMessageBox.question(
-                    self,
+                reply = self._msg(
+                    'question',
                     tr('confirm_overwrite_title'),
                     tr('import_config_exists', name=config_name),
-                    QMessageBox.Yes | QMessageBox.No,
-                    QMessageBox.No,
                 )
                 if reply == QMessageBox.Yes:
                     success, error, config_name = self.style_manager.import_config(
@@ -587,21 +792,14 @@ class MainDialog(QDialog):
         if success:
             self._load_configs()
             # Select the imported config
-            index = self.combo_configs.findText(config_name)
+            index = self._config_index.get(config_name, -1)
             if index >= 0:
                 self.combo_configs.setCurrentIndex(index)
-            QMessageBox.information(
-                self,
-                tr('import_config_title'),
-                tr('import_success', name=config_name),
-            )
+            self._msg('information', tr('import_config_title'), tr('import_success', name=config_name))
         else:
-            QMessageBox.warning(
-                self,
-                tr('error_title'),
-                tr('import_failed', error=error),
-            )
+            self._msg('warning', self._t['error_title'], tr('import_failed', error=error))
 
+    @pyqtSlot()
     def _on_apply_clicked(self):
         """Apply button clicked callback."""
         current_name = self.combo_configs.currentText()
@@ -610,16 +808,38 @@ class MainDialog(QDialog):
 
         config = self.style_manager.load_config(current_name)
         if not config:
-            QMessageBox.warning(self, tr('error_title'), tr('load_config_error', name=current_name))
+            self._msg('warning', self._t['error_title'], tr('load_config_error', name=current_name))
             return
 
         rules = config.get('rules', [])
         if not rules:
-            QMessageBox.information(self, tr('hint_title'), tr('no_rules_hint'))
+            self._msg('information', self._t['hint_title'], self._t['no_rules_hint'])
             return
 
-        # Apply styles
-        result = self.layer_processor.apply_styles(rules)
+        # Apply styles on the main thread (QGIS layer APIs are not thread-safe);
+        # a progress dialog keeps the UI repainting during long runs
+        progress = QProgressDialog(tr('apply_progress'), None, 0, 0, self)
+        progress.setWindowTitle("AutoStyle")
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(0)
+        progress.setAutoReset(False)
+
+        def on_progress(done: int, total: int):
+            if progress.maximum() != total:
+                progress.setMaximum(total)
+            # Show before setValue processes events, so the window modality
+            # blocks QGIS (e.g. removing layers) for the rest of the run
+            if not progress.isVisible():
+                progress.show()
+            progress.setValue(done)
+
+        # Events are only processed once the window-modal progress dialog is
+        # shown, so it also blocks input to this dialog while applying
+        try:
+            result = self.layer_processor.apply_styles(rules, progress=on_progress)
+        finally:
+            progress.close()
+            progress.deleteLater()
 
         # Display result
         success_count = result.get('success', 0)
@@ -627,94 +847,95 @@ class MainDialog(QDialog):
         unmatched_count = result.get('unmatched', 0)
         details = result.get('details', [])
 
-        message = f"{tr('apply_result_complete')}\n\n"
-        message += f"{tr('apply_result_success', count=success_count)}\n"
-        message += f"{tr('apply_result_failed', count=failed_count)}\n"
-        message += f"{tr('apply_result_unmatched', count=unmatched_count)}"
-
+        parts = [
+            f"{self._t['apply_result_complete']}\n",
+            tr('apply_result_success', count=success_count),
+            tr('apply_result_failed', count=failed_count),
+            tr('apply_result_unmatched', count=unmatched_count),
+        ]
         if details:
-            message += f"\n\n{tr('apply_result_details')}\n" + "\n".join(details)
+            parts.append(f"\n{self._t['apply_result_details']}")
+            parts.extend(details)
+        message = "\n".join(parts)
 
-        self._show_result_dialog(tr('apply_result_title'), message)
+        self._show_result_dialog(self._t['apply_result_title'], message)
 
+    @pyqtSlot()
+    @pyqtSlot(str)
     def _on_help_clicked(self, link=None):
         """Help link clicked callback."""
-        self._show_help_dialog(tr('help_title'), tr('help_content'))
+        # The help HTML is large and loaded lazily by tr(), so it is not kept in _t
+        self._show_help_dialog(self._t['help_title'], tr('help_content'))
 
     def _show_help_dialog(self, title: str, content: str):
         """
         Show help dialog.
 
+        The dialog is built on first use and reused for later calls.
+
         :param title: Dialog title
         :param content: HTML format content
         """
-        from qgis.PyQt.QtWidgets import QTextBrowser
-
-        dialog = QDialog(self)
-        dialog.setWindowTitle(title)
-        dialog.setMinimumSize(520, 480)
-        dialog.setModal(True)
-
-        layout = QVBoxLayout(dialog)
-        layout.setContentsMargins(16, 16, 16, 16)
-        layout.setSpacing(12)
-
-        text_browser = QTextBrowser()
-        text_browser.setHtml(content)
-        text_browser.setOpenExternalLinks(True)
-        text_browser.setStyleSheet("""
-            QTextBrowser {
-                background-color: #FFFFFF;
-                border: 1px solid #D0D0D0;
-                border-radius: 4px;
-                padding: 8px;
-            }
-        """)
-        layout.addWidget(text_browser)
-
-        btn_layout = QHBoxLayout()
-        btn_layout.addStretch()
-        btn_ok = QPushButton(tr('ok_button'))
-        btn_ok.setMinimumWidth(BUTTON_MIN_WIDTH)
-        btn_ok.setFixedHeight(BUTTON_HEIGHT)
-        btn_ok.setStyleSheet(BUTTON_STYLE_PRIMARY)
-        btn_ok.clicked.connect(dialog.accept)
-        btn_layout.addWidget(btn_ok)
-        btn_layout.addStretch()
-        layout.addLayout(btn_layout)
+        if self._help_dialog is None:
+            self._help_browser = QTextBrowser()
+            self._help_browser.setOpenExternalLinks(True)
+            self._help_browser.setObjectName(OBJECT_NAME_HELP_BROWSER)
+            self._help_dialog = self._build_text_dialog(self._help_browser, 520, 480)
+
+        if content != self._help_content:
+            self._help_browser.setHtml(content)
+            self._help_content = content
+        else:
+            self._help_browser.verticalScrollBar().setValue(0)
 
-        dialog.exec_()
+        self._help_dialog.setWindowTitle(title)
+        self._help_dialog.exec_()
 
     def _show_result_dialog(self, title: str, message: str):
         """
         Show result dialog.
 
+        The dialog is built on first use and reused for later calls.
+
         :param title: Dialog title
         :param message: Display content
         """
+        if self._result_dialog is None:
+            self._result_text = QTextEdit()
+            self._result_text.setReadOnly(True)
+            self._result_dialog = self._build_text_dialog(self._result_text, 450, 350)
+
+        self._result_text.setPlainText(message)
+        self._result_dialog.setWindowTitle(title)
+        self._result_dialog.exec_()
+
+    def _build_text_dialog(self, text_widget, min_width: int, min_height: int) -> QDialog:
+        """
+        Build a modal dialog showing a text widget above a centered OK button.
+
+        :param text_widget: Text widget to show
+        :param min_width: Minimum dialog width
+        :param min_height: Minimum dialog height
+        :return: Dialog
+        """
         dialog = QDialog(self)
-        dialog.setWindowTitle(title)
-        dialog.setMinimumSize(450, 350)
+        dialog.setMinimumSize(min_width, min_height)
         dialog.setModal(True)
 
         layout = QVBoxLayout(dialog)
         layout.setContentsMargins(16, 16, 16, 16)
         layout.setSpacing(12)
-
-        text_edit = QTextEdit()
-        text_edit.setPlainText(message)
-        text_edit.setReadOnly(True)
-        layout.addWidget(text_edit)
+        layout.addWidget(text_widget)
 
         btn_layout = QHBoxLayout()
         btn_layout.addStretch()
         btn_ok = QPushButton(tr('ok_button'))
         btn_ok.setMinimumWidth(BUTTON_MIN_WIDTH)
         btn_ok.setFixedHeight(BUTTON_HEIGHT)
-        btn_ok.setStyleSheet(BUTTON_STYLE_PRIMARY)
+        btn_ok.setObjectName(OBJECT_NAME_PRIMARY_BUTTON)
         btn_ok.clicked.connect(dialog.accept)
         btn_layout.addWidget(btn_ok)
         btn_layout.addStretch()
         layout.addLayout(btn_layout)
 
-        dialog.exec_()
+        return dialog